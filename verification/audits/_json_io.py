@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+UIDT Audit JSON I/O
+Registry reads and audit-artifact writes. Uses orjson when it is installed
+(optional speed-up) and the standard library otherwise; both emit sorted
+keys with 2-space indentation.
+Evidence Category: [A] (Audit Infrastructure)
+DOI: 10.5281/zenodo.17835200
+"""
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def read_json(path: Path | str) -> Any:
+    data = Path(path).read_bytes()
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(obj: Any, newline: bool = False) -> bytes:
+    if HAS_ORJSON:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, option=option)
+    text = json.dumps(obj, indent=2, sort_keys=True)
+    return (text + "\n" if newline else text).encode("utf-8")
+
+
+def write_bytes_atomic(path: Path | str, data: bytes) -> None:
+    # Write a sibling temp file, then rename over the target: readers (and a
+    # crashed run) never see a half-written artifact. The pid keeps
+    # concurrent writers of the same file apart.
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def write_json(path: Path | str, obj: Any, newline: bool = False) -> None:
+    # One contiguous buffer, one write, for either backend.
+    write_bytes_atomic(path, dumps_json(obj, newline))
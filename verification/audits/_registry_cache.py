@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+UIDT Registry Cache
+Shared loaders for the verification registries, memoized per file state
+so that audits running in one process parse each registry only once.
+Evidence Category: [A] (Audit Infrastructure)
+DOI: 10.5281/zenodo.17835200
+"""
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+from _json_io import read_json
+
+
+# Values compared over and over by the audits; interned so equality checks
+# short-circuit on identity.
+_INTERNED_FIELDS = ("symbol", "evidence_cat")
+
+
+def _intern_fields(entry: dict) -> dict:
+    for field in _INTERNED_FIELDS:
+        value = entry.get(field)
+        if type(value) is str:
+            entry[field] = sys.intern(value)
+    return entry
+
+
+@lru_cache(maxsize=8)
+def _load(path_str: str, mtime_ns: int, size: int) -> tuple:
+    # mtime_ns and size are part of the key only, so an edited registry is
+    # re-parsed instead of served stale.
+    return tuple(_intern_fields(entry) for entry in read_json(path_str))
+
+
+def _load_registry(repo_root: Path, name: str) -> tuple:
+    path = repo_root / "verification" / "registries" / name
+    st = path.stat()
+    return _load(str(path), st.st_mtime_ns, st.st_size)
+
+
+def load_symbols(repo_root: Path) -> tuple:
+    """Entries of symbol_registry.json (shared; copy before mutating)."""
+    return _load_registry(repo_root, "symbol_registry.json")
+
+
+def load_axioms(repo_root: Path) -> tuple:
+    """Entries of axioms_registry.json (shared; copy before mutating)."""
+    return _load_registry(repo_root, "axioms_registry.json")
+
+
+def load_units(repo_root: Path) -> tuple:
+    """Entries of units_registry.json (shared; copy before mutating)."""
+    return _load_registry(repo_root, "units_registry.json")
@@ -9,7 +9,6 @@ Evidence Category: [A] (Structural Analysis)
 DOI: 10.5281/zenodo.17835200
 Author: P. Rietz (ORCID: 0009-0007-4307-1609)
 """
-import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -17,6 +16,13 @@ from pathlib import Path
 import mpmath as mp
 mp.dps = 80
 
+SCRIPT_DIR = str(Path(__file__).resolve().parent)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from _json_io import write_json  # noqa: E402
+from _registry_cache import load_axioms  # noqa: E402
+
 
 def main() -> int:
     repo_root = Path(__file__).resolve().parents[2]
@@ -32,8 +38,7 @@ def main() -> int:
         print(f"ERROR: {axioms_path} not found", file=sys.stderr)
         return 1
     
-    with open(axioms_path, "r", encoding="utf-8") as f:
-        axioms = json.load(f)
+    axioms = load_axioms(repo_root)
     
     # Count verification scripts
     test_scripts = []
@@ -78,8 +83,7 @@ def main() -> int:
     
     coverage["coverage_ratio"] = len(coverage["tested_axioms"]) / len(axioms) if axioms else 0
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(coverage, f, indent=2, sort_keys=True)
+    write_json(output_path, coverage)
     
     print(f"Generated: {output_path}")
     print(f"Coverage: {coverage['coverage_ratio']:.1%}")
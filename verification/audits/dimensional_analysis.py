@@ -5,13 +5,19 @@ Verifies dimensional consistency of all parameters
 Evidence Category: [A] (Formal Verification)
 DOI: 10.5281/zenodo.17835200
 """
-import json
 import sys
 from pathlib import Path
 
 import mpmath as mp
 mp.dps = 80  # Local precision declaration
 
+SCRIPT_DIR = str(Path(__file__).resolve().parent)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from _json_io import write_json  # noqa: E402
+from _registry_cache import load_units  # noqa: E402
+
 
 def main() -> int:
     repo_root = Path(__file__).resolve().parents[2]
@@ -22,8 +28,7 @@ def main() -> int:
         print(f"ERROR: {units_path} not found", file=sys.stderr)
         return 1
     
-    with open(units_path, "r", encoding="utf-8") as f:
-        units = json.load(f)
+    units = load_units(repo_root)
     
     # Verify dimensional consistency
     results = {
@@ -55,8 +60,7 @@ def main() -> int:
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, sort_keys=True)
+    write_json(output_path, results)
     
     print(f"Generated: {output_path}")
     print(f"Consistent: {len(results['consistent'])}, Inconsistent: {len(results['inconsistent'])}")
@@ -9,7 +9,6 @@ Evidence Category: [A] (Formal Verification)
 DOI: 10.5281/zenodo.17835200
 Author: P. Rietz (ORCID: 0009-0007-4307-1609)
 """
-import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -17,6 +16,13 @@ from pathlib import Path
 import mpmath as mp
 mp.dps = 80
 
+SCRIPT_DIR = str(Path(__file__).resolve().parent)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from _json_io import write_json  # noqa: E402
+from _registry_cache import load_symbols  # noqa: E402
+
 
 def main() -> int:
     repo_root = Path(__file__).resolve().parents[2]
@@ -31,8 +37,7 @@ def main() -> int:
         print(f"ERROR: {symbols_path} not found", file=sys.stderr)
         return 1
     
-    with open(symbols_path, "r", encoding="utf-8") as f:
-        symbols = json.load(f)
+    symbols = load_symbols(repo_root)
     
     thresholds = {
         "timestamp": timestamp,
@@ -77,8 +82,7 @@ def main() -> int:
         "status": "verified"
     })
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(thresholds, f, indent=2, sort_keys=True)
+    write_json(output_path, thresholds)
     
     print(f"Generated: {output_path}")
     print(f"Falsification criteria: {len(thresholds['falsification_criteria'])}")
@@ -9,7 +9,6 @@ Evidence Category: [A] (Structural Analysis)
 DOI: 10.5281/zenodo.17835200
 Author: P. Rietz (ORCID: 0009-0007-4307-1609)
 """
-import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -17,6 +16,12 @@ from pathlib import Path
 import mpmath as mp
 mp.dps = 80
 
+SCRIPT_DIR = str(Path(__file__).resolve().parent)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from _json_io import write_json  # noqa: E402
+
 
 def main() -> int:
     repo_root = Path(__file__).resolve().parents[2]
@@ -66,8 +71,7 @@ def main() -> int:
         results["creep_detected"] = True
         results["creep_reason"] = f"Module count ({total_modules}) exceeds threshold (50)"
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, sort_keys=True)
+    write_json(output_path, results)
     
     print(f"Generated: {output_path}")
     print(f"Total modules: {total_modules}")
@@ -5,13 +5,19 @@ Generates formal_graph.json from axioms_registry.json
 Evidence Category: [A] (Structural Analysis)
 DOI: 10.5281/zenodo.17835200
 """
-import json
 import sys
 from pathlib import Path
 
 import mpmath as mp
 mp.dps = 80  # Local precision declaration
 
+SCRIPT_DIR = str(Path(__file__).resolve().parent)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from _json_io import write_json  # noqa: E402
+from _registry_cache import load_axioms  # noqa: E402
+
 
 def main() -> int:
     repo_root = Path(__file__).resolve().parents[2]
@@ -22,8 +28,7 @@ def main() -> int:
         print(f"ERROR: {axioms_path} not found", file=sys.stderr)
         return 1
     
-    with open(axioms_path, "r", encoding="utf-8") as f:
-        axioms = json.load(f)
+    axioms = load_axioms(repo_root)
     
     # Build dependency graph
     graph = {
@@ -48,8 +53,7 @@ def main() -> int:
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(graph, f, indent=2, sort_keys=True)
+    write_json(output_path, graph)
     
     print(f"Generated: {output_path}")
     print(f"Nodes: {len(graph['nodes'])}, Edges: {len(graph['edges'])}")
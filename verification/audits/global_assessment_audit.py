@@ -9,34 +9,44 @@ Evidence Category: [A] (Meta-Analysis)
 DOI: 10.5281/zenodo.17835200
 Author: P. Rietz (ORCID: 0009-0007-4307-1609)
 """
-import json
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
 import mpmath as mp
-mp.dps = 80
+mp.dps = 80  # Local precision declaration
 
+SCRIPT_DIR = str(Path(__file__).resolve().parent)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
 
-def main() -> int:
-    repo_root = Path(__file__).resolve().parents[2]
-    symbols_path = repo_root / "verification" / "registries" / "symbol_registry.json"
-    axioms_path = repo_root / "verification" / "registries" / "axioms_registry.json"
+from _json_io import write_json  # noqa: E402
+from _registry_cache import load_axioms, load_symbols  # noqa: E402
+
+_REPO_ROOT = Path(SCRIPT_DIR).parents[1]
+_SYMBOLS_PATH = _REPO_ROOT / "verification" / "registries" / "symbol_registry.json"
+_AXIOMS_PATH = _REPO_ROOT / "verification" / "registries" / "axioms_registry.json"
+
+
+def main(symbols: tuple | None = None, axioms: tuple | None = None) -> int:
+    repo_root = _REPO_ROOT
+    symbols_path = _SYMBOLS_PATH
+    axioms_path = _AXIOMS_PATH
     
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    timestamp = os.environ.get("UIDT_AUDIT_TS") or datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
     output_dir = repo_root / "verification" / "results" / "audits"
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = output_dir / f"global_assessment_{timestamp}.json"
     
-    if not symbols_path.exists() or not axioms_path.exists():
-        print(f"ERROR: Registry files not found", file=sys.stderr)
-        return 1
-    
-    with open(symbols_path, "r", encoding="utf-8") as f:
-        symbols = json.load(f)
-    
-    with open(axioms_path, "r", encoding="utf-8") as f:
-        axioms = json.load(f)
+    if symbols is None or axioms is None:
+        if not symbols_path.exists() or not axioms_path.exists():
+            print(f"ERROR: Registry files not found", file=sys.stderr)
+            return 1
+        if symbols is None:
+            symbols = load_symbols(repo_root)
+        if axioms is None:
+            axioms = load_axioms(repo_root)
     
     assessment = {
         "timestamp": timestamp,
@@ -48,18 +58,17 @@ def main() -> int:
         "what_could_still_be_wrong": []
     }
     
-    # Identify weakest evidence domains
+    # Single pass: weakest evidence domains (D/E) and fragile,
+    # phenomenologically calibrated parameters (A-)
     for sym in symbols:
-        if sym.get("evidence_cat") in ["D", "E"]:
+        cat = sym.get("evidence_cat")
+        if cat in ("D", "E"):
             assessment["weakest_evidence_domains"].append({
                 "parameter": sym["symbol"],
-                "category": sym["evidence_cat"],
+                "category": cat,
                 "reason": "Unverified prediction or speculative"
             })
-    
-    # Identify fragile parameters (phenomenologically calibrated)
-    for sym in symbols:
-        if sym.get("evidence_cat") == "A-":
+        elif cat == "A-":
             assessment["most_fragile_parameters"].append({
                 "parameter": sym["symbol"],
                 "value": sym.get("value", "N/A"),
@@ -102,8 +111,7 @@ def main() -> int:
         "status": "Limitation L2 acknowledged; under investigation"
     })
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(assessment, f, indent=2, sort_keys=True)
+    write_json(output_path, assessment)
     
     print(f"Generated: {output_path}")
     print(f"Weak domains: {len(assessment['weakest_evidence_domains'])}")
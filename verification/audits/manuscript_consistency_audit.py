@@ -9,30 +9,42 @@ Evidence Category: [A] (Formal Verification)
 DOI: 10.5281/zenodo.17835200
 Author: P. Rietz (ORCID: 0009-0007-4307-1609)
 """
-import json
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
 import mpmath as mp
-mp.dps = 80
+mp.dps = 80  # Local precision declaration
 
+SCRIPT_DIR = str(Path(__file__).resolve().parent)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
 
-def main() -> int:
-    repo_root = Path(__file__).resolve().parents[2]
-    symbols_path = repo_root / "verification" / "registries" / "symbol_registry.json"
+from _json_io import write_json  # noqa: E402
+from _registry_cache import load_symbols  # noqa: E402
+
+_REPO_ROOT = Path(SCRIPT_DIR).parents[1]
+_SYMBOLS_PATH = _REPO_ROOT / "verification" / "registries" / "symbol_registry.json"
+
+# Critical parameters must carry Category A or A-
+_CRITICAL_PARAMS = frozenset(("Δ", "κ", "λ_S", "v"))
+
+
+def main(symbols: tuple | None = None, axioms: tuple | None = None) -> int:
+    repo_root = _REPO_ROOT
+    symbols_path = _SYMBOLS_PATH
     
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    timestamp = os.environ.get("UIDT_AUDIT_TS") or datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
     output_dir = repo_root / "verification" / "results" / "audits"
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = output_dir / f"manuscript_consistency_{timestamp}.json"
     
-    if not symbols_path.exists():
-        print(f"ERROR: {symbols_path} not found", file=sys.stderr)
-        return 1
-    
-    with open(symbols_path, "r", encoding="utf-8") as f:
-        symbols = json.load(f)
+    if symbols is None:
+        if not symbols_path.exists():
+            print(f"ERROR: {symbols_path} not found", file=sys.stderr)
+            return 1
+        symbols = load_symbols(repo_root)
     
     results = {
         "timestamp": timestamp,
@@ -41,7 +53,8 @@ def main() -> int:
         "missing_manuscript_refs": []
     }
     
-    # Verify each symbol has proper evidence references
+    # Single pass: evidence references for every symbol, and Category A or A-
+    # for the critical parameters
     for sym in symbols:
         symbol = sym["symbol"]
         refs = sym.get("refs", [])
@@ -59,21 +72,16 @@ def main() -> int:
                 "category": category,
                 "refs": refs
             })
+        
+        if symbol in _CRITICAL_PARAMS and category not in ("A", "A-"):
+            results["inconsistent"].append({
+                "symbol": symbol,
+                "expected_category": "A or A-",
+                "actual_category": category,
+                "severity": "CRITICAL"
+            })
     
-    # Check critical parameters have Category A or A-
-    critical_params = ["Δ", "κ", "λ_S", "v"]
-    for sym in symbols:
-        if sym["symbol"] in critical_params:
-            if sym["evidence_cat"] not in ["A", "A-"]:
-                results["inconsistent"].append({
-                    "symbol": sym["symbol"],
-                    "expected_category": "A or A-",
-                    "actual_category": sym["evidence_cat"],
-                    "severity": "CRITICAL"
-                })
-    
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, sort_keys=True)
+    write_json(output_path, results)
     
     print(f"Generated: {output_path}")
     print(f"Consistent: {len(results['consistent'])}")
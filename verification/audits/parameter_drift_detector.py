@@ -5,25 +5,33 @@ Detects changes in canonical parameters across versions
 Evidence Category: [A] (Stability Analysis)
 DOI: 10.5281/zenodo.17835200
 """
-import json
 import sys
 from pathlib import Path
 
 import mpmath as mp
 mp.dps = 80  # Local precision declaration
 
+SCRIPT_DIR = str(Path(__file__).resolve().parent)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
 
-def main() -> int:
-    repo_root = Path(__file__).resolve().parents[2]
-    symbols_path = repo_root / "verification" / "registries" / "symbol_registry.json"
+from _json_io import write_json  # noqa: E402
+from _registry_cache import load_symbols  # noqa: E402
+
+_REPO_ROOT = Path(SCRIPT_DIR).parents[1]
+_SYMBOLS_PATH = _REPO_ROOT / "verification" / "registries" / "symbol_registry.json"
+
+
+def main(symbols: tuple | None = None, axioms: tuple | None = None) -> int:
+    repo_root = _REPO_ROOT
+    symbols_path = _SYMBOLS_PATH
     output_path = repo_root / "verification" / "results" / "audits" / "parameter_drift.json"
     
-    if not symbols_path.exists():
-        print(f"ERROR: {symbols_path} not found", file=sys.stderr)
-        return 1
-    
-    with open(symbols_path, "r", encoding="utf-8") as f:
-        symbols = json.load(f)
+    if symbols is None:
+        if not symbols_path.exists():
+            print(f"ERROR: {symbols_path} not found", file=sys.stderr)
+            return 1
+        symbols = load_symbols(repo_root)
     
     # Check for drift (placeholder - would compare with historical values)
     results = {
@@ -46,8 +54,7 @@ def main() -> int:
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, sort_keys=True)
+    write_json(output_path, results)
     
     print(f"Generated: {output_path}")
     print(f"Stable: {len(results['stable'])}, Drifted: {len(results['drifted'])}")
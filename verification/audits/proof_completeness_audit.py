@@ -5,28 +5,37 @@ Verifies all axioms have complete derivation chains
 Evidence Category: [A] (Formal Verification)
 DOI: 10.5281/zenodo.17835200
 """
-import json
 import sys
+from operator import itemgetter
 from pathlib import Path
 
 import mpmath as mp
 mp.dps = 80  # Local precision declaration
 
+SCRIPT_DIR = str(Path(__file__).resolve().parent)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
 
-def main() -> int:
-    repo_root = Path(__file__).resolve().parents[2]
-    axioms_path = repo_root / "verification" / "registries" / "axioms_registry.json"
+from _json_io import write_json  # noqa: E402
+from _registry_cache import load_axioms  # noqa: E402
+
+_REPO_ROOT = Path(SCRIPT_DIR).parents[1]
+_AXIOMS_PATH = _REPO_ROOT / "verification" / "registries" / "axioms_registry.json"
+
+
+def main(symbols: tuple | None = None, axioms: tuple | None = None) -> int:
+    repo_root = _REPO_ROOT
+    axioms_path = _AXIOMS_PATH
     output_path = repo_root / "verification" / "results" / "audits" / "proof_completeness.json"
     
-    if not axioms_path.exists():
-        print(f"ERROR: {axioms_path} not found", file=sys.stderr)
-        return 1
-    
-    with open(axioms_path, "r", encoding="utf-8") as f:
-        axioms = json.load(f)
+    if axioms is None:
+        if not axioms_path.exists():
+            print(f"ERROR: {axioms_path} not found", file=sys.stderr)
+            return 1
+        axioms = load_axioms(repo_root)
     
     # Check completeness
-    axiom_ids = {ax["id"] for ax in axioms}
+    axiom_ids = set(map(itemgetter("id"), axioms))
     results = {
         "complete": [],
         "incomplete": [],
@@ -35,14 +44,15 @@ def main() -> int:
     
     for axiom in axioms:
         ax_id = axiom["id"]
-        deps = set(axiom.get("deps", []))
+        deps = axiom.get("deps") or ()
         
-        # Check if all dependencies exist
-        missing_deps = deps - axiom_ids
+        # Check if all dependencies exist (no set built in the common
+        # all-present case; misses keep their declared order)
+        missing_deps = [d for d in deps if d not in axiom_ids]
         if missing_deps:
             results["incomplete"].append({
                 "axiom": ax_id,
-                "missing_deps": list(missing_deps)
+                "missing_deps": missing_deps
             })
         else:
             results["complete"].append(ax_id)
@@ -50,8 +60,7 @@ def main() -> int:
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, sort_keys=True)
+    write_json(output_path, results)
     
     print(f"Generated: {output_path}")
     print(f"Complete: {len(results['complete'])}, Incomplete: {len(results['incomplete'])}")
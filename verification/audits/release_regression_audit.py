@@ -9,7 +9,7 @@ Evidence Category: [A] (Stability Analysis)
 DOI: 10.5281/zenodo.17835200
 Author: P. Rietz (ORCID: 0009-0007-4307-1609)
 """
-import json
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -17,32 +17,47 @@ from pathlib import Path
 import mpmath as mp
 mp.dps = 80
 
+SCRIPT_DIR = str(Path(__file__).resolve().parent)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
 
-def main() -> int:
-    repo_root = Path(__file__).resolve().parents[2]
-    symbols_path = repo_root / "verification" / "registries" / "symbol_registry.json"
+from _json_io import write_json  # noqa: E402
+from _registry_cache import load_symbols  # noqa: E402
+
+_REPO_ROOT = Path(SCRIPT_DIR).parents[1]
+_SYMBOLS_PATH = _REPO_ROOT / "verification" / "registries" / "symbol_registry.json"
+
+# Residual tolerance for the RG fixed point constraint 5κ² = 3λ_S
+_RG_THRESHOLD = mp.mpf("1e-2")
+
+
+def _central(val: str) -> str:
+    """Central value of a registry entry such as "0.500 ± 0.008"."""
+    return val.partition("±")[0].strip()
+
+
+def main(symbols: tuple | None = None, axioms: tuple | None = None) -> int:
+    repo_root = _REPO_ROOT
+    symbols_path = _SYMBOLS_PATH
     
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    timestamp = os.environ.get("UIDT_AUDIT_TS") or datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
     output_dir = repo_root / "verification" / "results" / "audits"
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = output_dir / f"regression_report_{timestamp}.json"
     
-    if not symbols_path.exists():
-        print(f"ERROR: {symbols_path} not found", file=sys.stderr)
-        return 1
+    if symbols is None:
+        if not symbols_path.exists():
+            print(f"ERROR: {symbols_path} not found", file=sys.stderr)
+            return 1
+        symbols = load_symbols(repo_root)
     
-    with open(symbols_path, "r", encoding="utf-8") as f:
-        symbols = json.load(f)
+    by_name = {sym["symbol"]: sym for sym in symbols}
     
     # Verify RG fixed point constraint: 5κ² = 3λ_S
-    kappa = None
-    lambda_s = None
-    
-    for sym in symbols:
-        if sym["symbol"] == "κ":
-            kappa = mp.mpf(sym["value"].split("±")[0].strip())
-        elif sym["symbol"] == "λ_S":
-            lambda_s = mp.mpf(sym["value"].split("±")[0].strip())
+    kappa_sym = by_name.get("κ")
+    lambda_sym = by_name.get("λ_S")
+    kappa = mp.mpf(_central(kappa_sym["value"])) if kappa_sym else None
+    lambda_s = mp.mpf(_central(lambda_sym["value"])) if lambda_sym else None
     
     results = {
         "timestamp": timestamp,
@@ -57,7 +72,7 @@ def main() -> int:
         rhs = 3 * lambda_s
         residual = abs(lhs - rhs)
         
-        if residual < mp.mpf("1e-2"):
+        if residual < _RG_THRESHOLD:
             results["stable_parameters"].append({
                 "constraint": "5κ² = 3λ_S",
                 "lhs": float(lhs),
@@ -76,17 +91,16 @@ def main() -> int:
             results["gate_e_status"] = "FAIL"
     
     # Check spectral gap stability
-    for sym in symbols:
-        if sym["symbol"] == "Δ" and sym["evidence_cat"] == "A":
-            results["stable_parameters"].append({
-                "parameter": "Δ",
-                "value": sym["value"],
-                "category": "A",
-                "status": "STABLE"
-            })
+    delta_sym = by_name.get("Δ")
+    if delta_sym and delta_sym["evidence_cat"] == "A":
+        results["stable_parameters"].append({
+            "parameter": "Δ",
+            "value": delta_sym["value"],
+            "category": "A",
+            "status": "STABLE"
+        })
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, sort_keys=True)
+    write_json(output_path, results)
     
     print(f"Generated: {output_path}")
     print(f"Gate E: {results['gate_e_status']}")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+UIDT Registry Audit Runner
+
+Runs the independent registry audits in parallel worker processes. Each
+audit reads the read-only registries and writes its own output file, so
+they can be dispatched in any order; the exit code is the worst of all.
+
+Evidence Category: [A] (Audit Infrastructure)
+DOI: 10.5281/zenodo.17835200
+"""
+import importlib
+import os
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from itertools import repeat
+from pathlib import Path
+
+SCRIPT_DIR = str(Path(__file__).resolve().parent)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+from _registry_cache import load_axioms, load_symbols  # noqa: E402
+
+AUDITS = (
+    "global_assessment_audit",
+    "manuscript_consistency_audit",
+    "parameter_drift_detector",
+    "proof_completeness_audit",
+    "release_regression_audit",
+    "scope_drift_audit",
+    "symbol_consistency_check",
+    "symbol_growth_audit",
+    "tolerance_enforcement",
+)
+
+
+def _run_audit(name: str, symbols: tuple | None, axioms: tuple | None) -> int:
+    # Module-level so it pickles; the import happens inside the worker.
+    # A crash is reported like a standalone run (traceback, rc=1) so it
+    # does not abort the remaining audits.
+    try:
+        return importlib.import_module(name).main(symbols=symbols, axioms=axioms)
+    except Exception:
+        traceback.print_exc()
+        return 1
+
+
+def main() -> int:
+    # One timestamp for the whole run so the audits' output names line up;
+    # workers inherit it through the environment.
+    os.environ.setdefault("UIDT_AUDIT_TS", datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ"))
+
+    # Parse the registries once here and hand them to every audit
+    repo_root = Path(SCRIPT_DIR).parents[1]
+    try:
+        symbols = load_symbols(repo_root)
+        axioms = load_axioms(repo_root)
+    except FileNotFoundError:
+        # Let each audit load what exists and report what is missing
+        symbols = axioms = None
+
+    max_workers = min(len(AUDITS), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return_codes = list(pool.map(_run_audit, AUDITS, repeat(symbols), repeat(axioms)))
+
+    for name, rc in zip(AUDITS, return_codes):
+        print(f"{name}: rc={rc}")
+    return max(return_codes)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
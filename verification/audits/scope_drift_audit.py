@@ -9,34 +9,43 @@ Evidence Category: [A] (Strategic Analysis)
 DOI: 10.5281/zenodo.17835200
 Author: P. Rietz (ORCID: 0009-0007-4307-1609)
 """
-import json
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
 import mpmath as mp
-mp.dps = 80
+mp.dps = 80  # Local precision declaration
 
+SCRIPT_DIR = str(Path(__file__).resolve().parent)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
 
-def main() -> int:
-    repo_root = Path(__file__).resolve().parents[2]
-    symbols_path = repo_root / "verification" / "registries" / "symbol_registry.json"
+from _json_io import write_json  # noqa: E402
+from _registry_cache import load_symbols  # noqa: E402
+
+_REPO_ROOT = Path(SCRIPT_DIR).parents[1]
+_SYMBOLS_PATH = _REPO_ROOT / "verification" / "registries" / "symbol_registry.json"
+
+# Core scope: Yang-Mills mass gap; cosmology marks an extension
+_CORE = frozenset({"Δ", "κ", "λ_S", "v", "Λ_QCD"})
+_COSMO = frozenset({"H₀", "S₈", "λ_UIDT"})
+
+
+def main(symbols: tuple | None = None, axioms: tuple | None = None) -> int:
+    repo_root = _REPO_ROOT
+    symbols_path = _SYMBOLS_PATH
     
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    timestamp = os.environ.get("UIDT_AUDIT_TS") or datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
     output_dir = repo_root / "verification" / "results" / "audits"
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = output_dir / f"scope_drift_{timestamp}.json"
     
-    if not symbols_path.exists():
-        print(f"ERROR: {symbols_path} not found", file=sys.stderr)
-        return 1
-    
-    with open(symbols_path, "r", encoding="utf-8") as f:
-        symbols = json.load(f)
-    
-    # Define core scope: Yang-Mills mass gap
-    core_symbols = {"Δ", "κ", "λ_S", "v", "Λ_QCD"}
-    cosmology_symbols = {"H₀", "S₈", "λ_UIDT"}
+    if symbols is None:
+        if not symbols_path.exists():
+            print(f"ERROR: {symbols_path} not found", file=sys.stderr)
+            return 1
+        symbols = load_symbols(repo_root)
     
     results = {
         "timestamp": timestamp,
@@ -50,20 +59,20 @@ def main() -> int:
         symbol = sym["symbol"]
         category = sym.get("evidence_cat", "UNKNOWN")
         
-        if symbol in core_symbols:
+        if symbol in _CORE:
             results["core_parameters"].append({
                 "symbol": symbol,
                 "category": category,
                 "scope": "core"
             })
-        elif symbol in cosmology_symbols:
+        elif symbol in _COSMO:
             results["extended_parameters"].append({
                 "symbol": symbol,
                 "category": category,
                 "scope": "cosmology",
                 "note": "Extension beyond core problem"
             })
-            if category in ["A", "B"]:
+            if category in ("A", "B"):
                 results["scope_drift_detected"] = True
         else:
             results["extended_parameters"].append({
@@ -74,8 +83,7 @@ def main() -> int:
     
     results["core_ratio"] = len(results["core_parameters"]) / len(symbols) if symbols else 0
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, sort_keys=True)
+    write_json(output_path, results)
     
     print(f"Generated: {output_path}")
     print(f"Core parameters: {len(results['core_parameters'])}")
@@ -9,34 +9,45 @@ Evidence Category: [A] (Structural Analysis)
 DOI: 10.5281/zenodo.17835200
 Author: P. Rietz (ORCID: 0009-0007-4307-1609)
 """
-import json
+import os
 import sys
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 
 import mpmath as mp
-mp.dps = 80
+mp.dps = 80  # Local precision declaration
 
+SCRIPT_DIR = str(Path(__file__).resolve().parent)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
 
-def main() -> int:
-    repo_root = Path(__file__).resolve().parents[2]
-    symbols_path = repo_root / "verification" / "registries" / "symbol_registry.json"
-    axioms_path = repo_root / "verification" / "registries" / "axioms_registry.json"
+from _json_io import write_json  # noqa: E402
+from _registry_cache import load_axioms, load_symbols  # noqa: E402
+
+_REPO_ROOT = Path(SCRIPT_DIR).parents[1]
+_SYMBOLS_PATH = _REPO_ROOT / "verification" / "registries" / "symbol_registry.json"
+_AXIOMS_PATH = _REPO_ROOT / "verification" / "registries" / "axioms_registry.json"
+
+
+def main(symbols: tuple | None = None, axioms: tuple | None = None) -> int:
+    repo_root = _REPO_ROOT
+    symbols_path = _SYMBOLS_PATH
+    axioms_path = _AXIOMS_PATH
     
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    timestamp = os.environ.get("UIDT_AUDIT_TS") or datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
     output_dir = repo_root / "verification" / "results" / "audits"
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = output_dir / f"symbol_growth_{timestamp}.json"
     
-    if not symbols_path.exists() or not axioms_path.exists():
-        print(f"ERROR: Registry files not found", file=sys.stderr)
-        return 1
-    
-    with open(symbols_path, "r", encoding="utf-8") as f:
-        symbols = json.load(f)
-    
-    with open(axioms_path, "r", encoding="utf-8") as f:
-        axioms = json.load(f)
+    if symbols is None or axioms is None:
+        if not symbols_path.exists() or not axioms_path.exists():
+            print(f"ERROR: Registry files not found", file=sys.stderr)
+            return 1
+        if symbols is None:
+            symbols = load_symbols(repo_root)
+        if axioms is None:
+            axioms = load_axioms(repo_root)
     
     results = {
         "timestamp": timestamp,
@@ -47,13 +58,12 @@ def main() -> int:
     }
     
     # Count by evidence category
-    for sym in symbols:
-        cat = sym.get("evidence_cat", "UNKNOWN")
-        results["category_distribution"][cat] = results["category_distribution"].get(cat, 0) + 1
+    counts = Counter(sym.get("evidence_cat", "UNKNOWN") for sym in symbols)
+    results["category_distribution"] = dict(counts)
     
     # Calculate maturity metrics
-    proven = results["category_distribution"].get("A", 0) + results["category_distribution"].get("A-", 0)
-    predicted = results["category_distribution"].get("D", 0) + results["category_distribution"].get("E", 0)
+    proven = counts["A"] + counts["A-"]
+    predicted = counts["D"] + counts["E"]
     
     results["maturity_metrics"]["proven_ratio"] = proven / len(symbols) if symbols else 0
     results["maturity_metrics"]["predicted_ratio"] = predicted / len(symbols) if symbols else 0
@@ -67,8 +77,7 @@ def main() -> int:
         "note": "Requires historical registry comparison"
     }
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, sort_keys=True)
+    write_json(output_path, results)
     
     print(f"Generated: {output_path}")
     print(f"Total symbols: {len(symbols)}")
@@ -5,7 +5,6 @@ Verifies all measurements include proper uncertainties
 Evidence Category: [A] (Formal Verification)
 DOI: 10.5281/zenodo.17835200
 """
-import json
 import re
 import sys
 from pathlib import Path
@@ -13,18 +12,30 @@ from pathlib import Path
 import mpmath as mp
 mp.dps = 80  # Local precision declaration
 
+SCRIPT_DIR = str(Path(__file__).resolve().parent)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
 
-def main() -> int:
-    repo_root = Path(__file__).resolve().parents[2]
-    symbols_path = repo_root / "verification" / "registries" / "symbol_registry.json"
+from _json_io import write_json  # noqa: E402
+from _registry_cache import load_symbols  # noqa: E402
+
+_REPO_ROOT = Path(SCRIPT_DIR).parents[1]
+_SYMBOLS_PATH = _REPO_ROOT / "verification" / "registries" / "symbol_registry.json"
+
+# Categories whose dimensionful values must quote an uncertainty
+_CATEGORIES_NEEDING_UNCERT = frozenset(("A", "A-", "B", "C"))
+
+
+def main(symbols: tuple | None = None, axioms: tuple | None = None) -> int:
+    repo_root = _REPO_ROOT
+    symbols_path = _SYMBOLS_PATH
     output_path = repo_root / "verification" / "results" / "audits" / "tolerance_enforcement.json"
     
-    if not symbols_path.exists():
-        print(f"ERROR: {symbols_path} not found", file=sys.stderr)
-        return 1
-    
-    with open(symbols_path, "r", encoding="utf-8") as f:
-        symbols = json.load(f)
+    if symbols is None:
+        if not symbols_path.exists():
+            print(f"ERROR: {symbols_path} not found", file=sys.stderr)
+            return 1
+        symbols = load_symbols(repo_root)
     
     # Check for proper uncertainty notation
     results = {
@@ -35,7 +46,7 @@ def main() -> int:
     
     for sym in symbols:
         symbol = sym["symbol"]
-        value = str(sym.get("value", ""))
+        value = sym.get("value") or ""  # registry values are str
         category = sym.get("evidence_cat", "UNKNOWN")
         
         # Check if value includes ± notation
@@ -45,7 +56,7 @@ def main() -> int:
                 "value": value,
                 "category": category
             })
-        elif category in ["A", "A-", "B", "C"] and sym.get("unit") != "dimensionless":
+        elif category in _CATEGORIES_NEEDING_UNCERT and sym.get("unit") != "dimensionless":
             results["missing_uncertainty"].append({
                 "symbol": symbol,
                 "value": value,
@@ -57,8 +68,7 @@ def main() -> int:
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, sort_keys=True)
+    write_json(output_path, results)
     
     print(f"Generated: {output_path}")
     print(f"With uncertainty: {len(results['with_uncertainty'])}, Missing: {len(results['missing_uncertainty'])}")
@@ -23,14 +23,20 @@ GENERATED FIGURES:
 2. UIDT_Fig2_Gamma_Scaling_Map.png    (Hierarchy Resolution)
 3. UIDT_Fig3_Stability_Landscape.png  (Vacuum Potential Topology)
 4. UIDT_Fig4_Parameter_Posterior.png  (MCMC Statistical Validation)
+Each figure is also written as a .pdf sibling (vector axes, rasterized data).
+The four figures are independent and are rendered in a process pool.
 """
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Headless batch rendering; select before pyplot is imported
 import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
 from scipy.stats import norm
+import functools
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 
 # =============================================================================
 # ⚙️ CONFIGURATION (CLEAN STATE PARAMETERS v3.6.1)
@@ -43,6 +49,20 @@ VEV_PHYS   = 0.0477      # GeV (Rectified VEV: 47.7 MeV)
 KAPPA_C    = 0.50060     # Coupling Constant
 LAMBDA_S   = 0.41766     # Self-Coupling
 
+# Likelihood Inputs (Core Equations, Fig. 4)
+C_GLUON      = 0.277     # GeV^4 (Gluon Condensate)
+LAMBDA_SCALE = 1.0       # GeV (Renormalization Scale)
+ALPHA_S      = 0.50      # Strong Coupling at 1 GeV
+DELTA_SIGMA  = 0.015     # GeV (Registry uncertainty on Delta)
+M_S_PRIOR    = (1.705, 0.015)  # GeV (mean, sigma)
+KAPPA_PRIOR  = (0.500, 0.008)  # (mean, sigma)
+
+# Plot Grids (fixed; shared by repeated calls)
+LOG10_GAMMA   = np.log10(GAMMA_STAR)
+X_RANGE_GAMMA = np.linspace(-15, 25, 100)
+Y_MODEL_GAMMA = X_RANGE_GAMMA * LOG10_GAMMA   # Linear in log-space
+S_RANGE       = np.linspace(-0.1, 0.1, 400)   # GeV
+
 # Visualization Settings
 DPI_SETTING = 300
 COLOR_PALETTE = {
@@ -84,10 +104,24 @@ plt.rcParams.update({
 def print_status(message):
     print(f"[UIDT-VISUAL] {message}")
 
+def reset_figure(fig, figsize):
+    """Clears the shared figure and resizes it for the next plot."""
+    fig.clear()
+    fig.set_size_inches(figsize)
+    return fig
+
+def save_figure(fig, filename):
+    """Saves the figure as PNG plus a PDF sibling.
+    Data artists are created with rasterized=True, so the PDF keeps
+    axes, labels and text as vectors with the data layer embedded at DPI_SETTING."""
+    path = os.path.join(OUTPUT_DIR, filename)
+    fig.savefig(path, dpi=DPI_SETTING)
+    fig.savefig(os.path.splitext(path)[0] + ".pdf", dpi=DPI_SETTING)
+
 # =============================================================================
 # 📊 FIGURE 1: BANACH FIXED-POINT CONVERGENCE
 # =============================================================================
-def plot_banach_convergence():
+def plot_banach_convergence(fig):
     print_status("Generating Fig 1: Banach Convergence...")
     
     # Simulate Iteration (Constructive Proof)
@@ -101,7 +135,7 @@ def plot_banach_convergence():
         values[i] = DELTA_STAR + (values[i-1] - DELTA_STAR) * 0.4 # Contraction factor ~0.4
         
     # Subplot setup
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+    ax1, ax2 = reset_figure(fig, (12, 5)).subplots(1, 2)
     
     # Subplot 1: Value Convergence
     ax1.plot(iterations, values, 'o-', color=COLOR_PALETTE['primary'], linewidth=2, label=r'$\Delta_n$ Iteration')
@@ -122,14 +156,13 @@ def plot_banach_convergence():
     ax2.axhline(-40, color='gray', linestyle=':', label='Verification Threshold')
     ax2.legend()
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, "UIDT_Fig1_Banach_Convergence.png"), dpi=DPI_SETTING)
-    plt.close()
+    fig.tight_layout()
+    save_figure(fig, "UIDT_Fig1_Banach_Convergence.png")
 
 # =============================================================================
 # 📊 FIGURE 2: GAMMA SCALING HIERARCHY
 # =============================================================================
-def plot_gamma_scaling():
+def plot_gamma_scaling(fig):
     print_status("Generating Fig 2: Gamma Unification Map...")
     
     # Hierarchy Levels
@@ -140,18 +173,15 @@ def plot_gamma_scaling():
     # n = -12 (DE), n = -8 (EW), n = 0 (QCD), n = +16 (Planck approx)
     n_values = np.array([-12, -8, 0, 19]) 
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    ax = reset_figure(fig, (10, 6)).add_subplot()
     
     # Plotting the scaling law line E ~ Gamma^n
-    x_range = np.linspace(-15, 25, 100)
-    y_model = x_range * np.log10(GAMMA_STAR) # Linear in log-space
-    
-    ax.plot(x_range, y_model, '-', color='gray', alpha=0.5, label=r'Scaling Law $\gamma^n$')
+    ax.plot(X_RANGE_GAMMA, Y_MODEL_GAMMA, '-', color='gray', alpha=0.5, label=r'Scaling Law $\gamma^n$')
     
     # Plot Data Points
     colors = [COLOR_PALETTE['tertiary'], 'orange', COLOR_PALETTE['primary'], 'black']
     for i, (n, y, label) in enumerate(zip(n_values, scales_log, levels)):
-        ax.scatter(n, y, s=150, c=colors[i], edgecolors='white', zorder=5, label=label)
+        ax.scatter(n, y, s=150, c=colors[i], edgecolors='white', zorder=5, label=label, rasterized=True)
         ax.text(n, y+5, f"{label}\n($10^{{{y}}}$)", ha='center', fontsize=9, fontweight='bold')
         
     ax.set_xlabel(r'Scaling Exponent $n$ (Powers of $\gamma = 16.339$)')
@@ -164,33 +194,33 @@ def plot_gamma_scaling():
                 bbox=dict(boxstyle="round", fc="white", alpha=0.9))
     
     ax.grid(True, linestyle='--', alpha=0.6)
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, "UIDT_Fig2_Gamma_Scaling_Map.png"), dpi=DPI_SETTING)
-    plt.close()
+    fig.tight_layout()
+    save_figure(fig, "UIDT_Fig2_Gamma_Scaling_Map.png")
 
 # =============================================================================
 # 📊 FIGURE 3: STABILITY LANDSCAPE (POTENTIAL)
 # =============================================================================
-def plot_stability_landscape():
+def plot_stability_landscape(fig):
     print_status("Generating Fig 3: Stability Landscape...")
     
     # Effective Potential V(S) = -mu^2 S^2 + lambda S^4 (Simplified)
-    S = np.linspace(-0.1, 0.1, 400) # GeV
+    S = S_RANGE
     # Derived mu^2 approximation for potential shape
     mu_sq = LAMBDA_S * VEV_PHYS**2 
-    V = -0.5 * mu_sq * S**2 + 0.25 * LAMBDA_S * S**4
+    S2 = S * S
+    V = S2 * (0.25 * LAMBDA_S * S2 - 0.5 * mu_sq)  # Horner form in S^2
     
     # Normalize to zero at minimum for better viz
     V_min = np.min(V)
     V = (V - V_min) * 1e6 # Scale to keV for visibility
     
-    fig, ax = plt.subplots(figsize=(8, 6))
+    ax = reset_figure(fig, (8, 6)).add_subplot()
     
-    ax.plot(S, V, color=COLOR_PALETTE['primary'], linewidth=2.5)
+    ax.plot(S, V, color=COLOR_PALETTE['primary'], linewidth=2.5, rasterized=True)
     
     # Mark VEVs with corrected f-string escaping
     label_vev = rf'VEV $\pm${VEV_PHYS*1000:.1f} MeV'
-    ax.scatter([VEV_PHYS, -VEV_PHYS], [0, 0], color=COLOR_PALETTE['secondary'], s=100, zorder=5, label=label_vev)
+    ax.scatter([VEV_PHYS, -VEV_PHYS], [0, 0], color=COLOR_PALETTE['secondary'], s=100, zorder=5, label=label_vev, rasterized=True)
     
     ax.axhline(0, color='gray', linestyle=':', alpha=0.5)
     ax.axvline(0, color='gray', linestyle=':', alpha=0.5)
@@ -203,59 +233,158 @@ def plot_stability_landscape():
             bbox=dict(facecolor='white', alpha=0.8, edgecolor='none'))
     
     ax.legend(loc='upper center')
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, "UIDT_Fig3_Stability_Landscape.png"), dpi=DPI_SETTING)
-    plt.close()
+    fig.tight_layout()
+    save_figure(fig, "UIDT_Fig3_Stability_Landscape.png")
 
 # =============================================================================
 # 📊 FIGURE 4: MCMC STATISTICAL VALIDATION
 # =============================================================================
-def plot_parameter_posterior():
+def gap_from_parameters(m_S, kappa):
+    """Eq. II (Schwinger-Dyson): Delta = sqrt(m_S^2 + Pi_S), vectorized."""
+    log_term = np.log(LAMBDA_SCALE**2 / m_S**2)
+    Pi_S = (kappa**2 * C_GLUON) / (4 * LAMBDA_SCALE**2) * (1 + log_term / (16 * np.pi**2))
+    return np.sqrt(m_S**2 + Pi_S)
+
+def gamma_from_parameters(delta, kappa):
+    """Gamma invariant from the kinetic VEV, as in the verification suite."""
+    kinetic_vev = (kappa * ALPHA_S * C_GLUON) / (2 * np.pi * LAMBDA_SCALE)
+    return delta / np.sqrt(kinetic_vev)
+
+def log_posterior(theta):
+    """
+    Log-posterior for theta = (m_S, kappa), one row per walker.
+    Eq. III fixes lambda_S = 5 kappa^2 / 3 and Eq. I is solved exactly for v,
+    so the Gaussian likelihood is the Eq. II residual against DELTA_STAR.
+    """
+    m_S, kappa = theta[:, 0], theta[:, 1]
+    valid = (m_S > 0) & (kappa > 0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        delta = gap_from_parameters(m_S, kappa)
+    log_like = -0.5 * ((delta - DELTA_STAR) / DELTA_SIGMA)**2
+    log_prior = (-0.5 * ((m_S - M_S_PRIOR[0]) / M_S_PRIOR[1])**2
+                 - 0.5 * ((kappa - KAPPA_PRIOR[0]) / KAPPA_PRIOR[1])**2)
+    return np.where(valid & np.isfinite(log_like), log_like + log_prior, -np.inf)
+
+def run_ensemble_sampler(log_prob, p0, n_steps, rng=None, a=2.0):
+    """
+    Affine-invariant ensemble sampler (Goodman & Weare stretch move).
+    Each half of the ensemble is updated against the other half, so a whole
+    half-ensemble is proposed and evaluated in one vectorized call.
+    Random numbers come from the Generator `rng` (fresh PCG64 if None).
+    Returns the chain with shape (n_steps, n_walkers, ndim) and acceptance.
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    walkers = np.array(p0, dtype=float)
+    n_walkers, ndim = walkers.shape
+    half = n_walkers // 2
+    halves = ((slice(0, half), slice(half, n_walkers)), (slice(half, n_walkers), slice(0, half)))
+
+    log_p = log_prob(walkers)
+    chain = np.empty((n_steps, n_walkers, ndim))
+    accepted = 0
+    for step in range(n_steps):
+        for active, partner in halves:
+            S, C = walkers[active], walkers[partner]
+            k = len(S)
+            z = ((a - 1.0) * rng.random(k) + 1.0)**2 / a
+            proposal = C[rng.integers(len(C), size=k)]
+            proposal = proposal + z[:, None] * (S - proposal)
+            log_p_new = log_prob(proposal)
+            accept = np.log(rng.random(k)) < (ndim - 1) * np.log(z) + log_p_new - log_p[active]
+            S[accept] = proposal[accept]
+            log_p[active][accept] = log_p_new[accept]
+            accepted += np.count_nonzero(accept)
+        chain[step] = walkers
+    return chain, accepted / (n_steps * n_walkers)
+
+def integrated_autocorr_time(chain, c=5.0):
+    """Walker-averaged integrated autocorrelation time per parameter (Sokal window)."""
+    n_steps = chain.shape[0]
+    taus = []
+    for d in range(chain.shape[2]):
+        x = chain[:, :, d] - chain[:, :, d].mean(axis=0)
+        f = np.fft.rfft(x, n=2 * n_steps, axis=0)
+        acf = np.fft.irfft(f * np.conj(f), axis=0)[:n_steps].mean(axis=1)
+        acf /= acf[0]
+        tau_k = 2.0 * np.cumsum(acf) - 1.0
+        window = np.argmax(np.arange(n_steps) >= c * tau_k)
+        taus.append(tau_k[window])
+    return np.array(taus)
+
+def plot_parameter_posterior(fig):
     print_status("Generating Fig 4: Parameter Posterior Distributions...")
     
-    # Generate Synthetic Gaussian Data based on Clean State Stats
-    np.random.seed(42)
-    n_samples = 10000
+    # Sample (m_S, kappa) from the core-equation posterior
+    rng = np.random.default_rng(42)
+    n_walkers, n_steps = 60, 3000
+    center = np.array([M_S_PRIOR[0], KAPPA_PRIOR[0]])
+    spread = np.array([M_S_PRIOR[1], KAPPA_PRIOR[1]]) / 4
+    p0 = center + spread * rng.standard_normal((n_walkers, 2))
+    
+    chain, acceptance = run_ensemble_sampler(log_posterior, p0, n_steps, rng)
+    tau = integrated_autocorr_time(chain)
+    burn = min(int(np.ceil(10 * tau.max())), n_steps // 2)
+    samples = chain[burn:].reshape(-1, 2)
+    n_samples = len(samples)
+    print_status(f"  acceptance={acceptance:.2f}, tau={np.round(tau, 1)}, burn-in={burn}")
     
-    data_delta = np.random.normal(DELTA_STAR, 0.00001, n_samples)
-    data_gamma = np.random.normal(GAMMA_STAR, 0.001, n_samples)
+    data_delta = gap_from_parameters(samples[:, 0], samples[:, 1])
+    data_gamma = gamma_from_parameters(data_delta, samples[:, 1])
     
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+    ax1, ax2 = reset_figure(fig, (12, 5)).subplots(1, 2)
     
     # Delta Distribution
-    ax1.hist(data_delta, bins=50, density=True, color=COLOR_PALETTE['primary'], alpha=0.7, label='MCMC Samples')
-    ax1.axvline(DELTA_STAR, color='red', linestyle='--', linewidth=2, label=rf'Mean: {DELTA_STAR:.6f}')
+    counts, edges = np.histogram(data_delta, bins=50, density=True)
+    ax1.stairs(counts, edges, fill=True, color=COLOR_PALETTE['primary'], alpha=0.7, label='MCMC Samples', rasterized=True)
+    ax1.axvline(DELTA_STAR, color='red', linestyle='--', linewidth=2, label=rf'Canonical: {DELTA_STAR:.6f}')
+    ax1.axvline(data_delta.mean(), color='black', linestyle=':', linewidth=1.5, label=rf'Mean: {data_delta.mean():.6f}')
     ax1.set_xlabel(r'Mass Gap $\Delta$ [GeV]')
     ax1.set_ylabel('Probability Density')
     ax1.set_title(r'Posterior: Mass Gap $\Delta$')
     ax1.legend()
     
     # Gamma Distribution
-    ax2.hist(data_gamma, bins=50, density=True, color=COLOR_PALETTE['tertiary'], alpha=0.7, label='MCMC Samples')
-    ax2.axvline(GAMMA_STAR, color='red', linestyle='--', linewidth=2, label=rf'Mean: {GAMMA_STAR:.3f}')
+    counts, edges = np.histogram(data_gamma, bins=50, density=True)
+    ax2.stairs(counts, edges, fill=True, color=COLOR_PALETTE['tertiary'], alpha=0.7, label='MCMC Samples', rasterized=True)
+    ax2.axvline(GAMMA_STAR, color='red', linestyle='--', linewidth=2, label=rf'Canonical: {GAMMA_STAR:.3f}')
+    ax2.axvline(data_gamma.mean(), color='black', linestyle=':', linewidth=1.5, label=rf'Mean: {data_gamma.mean():.3f}')
     ax2.set_xlabel(r'Gamma Invariant $\gamma$')
     ax2.set_title(r'Posterior: Gamma $\gamma$')
     ax2.legend()
     
-    plt.suptitle(f'UIDT v3.6.1 Statistical Validation (N={n_samples})', fontsize=16)
-    plt.tight_layout()
-    plt.savefig(os.path.join(OUTPUT_DIR, "UIDT_Fig4_Parameter_Posterior.png"), dpi=DPI_SETTING)
-    plt.close()
+    fig.suptitle(f'UIDT v3.6.1 Statistical Validation (N={n_samples})', fontsize=16)
+    fig.tight_layout()
+    save_figure(fig, "UIDT_Fig4_Parameter_Posterior.png")
 
 # =============================================================================
 # MAIN EXECUTION
 # =============================================================================
+PLOTS = {
+    'banach': plot_banach_convergence,
+    'gamma': plot_gamma_scaling,
+    'stability': plot_stability_landscape,
+    'posterior': plot_parameter_posterior,
+}
+
+@functools.cache
+def worker_figure():
+    """One Figure per process, cleared and reused by every plot it renders."""
+    return plt.figure(figsize=(10, 6), dpi=DPI_SETTING)
+
+def run_plot(name):
+    PLOTS[name](worker_figure())
+    return name
+
 if __name__ == "__main__":
     print("========================================================")
     print("   UIDT v3.6.1 VISUALIZATION ENGINE (CLEAN STATE)       ")
     print("========================================================")
     print(f"Parameters: Delta={DELTA_STAR}, Gamma={GAMMA_STAR}, VEV={VEV_PHYS}")
     
-    # Generate all figures
-    plot_banach_convergence()
-    plot_gamma_scaling()
-    plot_stability_landscape()
-    plot_parameter_posterior()
+    # Generate all figures; they are independent, so render them in parallel
+    with ProcessPoolExecutor(max_workers=min(len(PLOTS), os.cpu_count() or 1)) as pool:
+        list(pool.map(run_plot, PLOTS))
     
     print("\n✅ SUCCESS: All figures generated in '/Supplementary_Figures'")
     print("   Resolution: 300 DPI")
@@ -24,10 +24,12 @@ import numpy as np
 from scipy.optimize import root
 import platform
 import hashlib
+import functools
 import datetime
 import sys
 import os
 import inspect
+import io
 import mpmath
 from mpmath import mp
 
@@ -44,26 +46,33 @@ ALPHA_S = 0.50         # Strong Coupling at 1 GeV (Non-perturbative)
 # Target Mass Gap from Lattice QCD (to constrain the system)
 DELTA_TARGET = 1.710   # GeV
 
+# Shared canonical constants (80-digit mpf, evaluated once in uidt_constants)
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+from uidt_constants import K
+
 # AXIOM: Gamma Invariant (Fixed, not derived)
-GAMMA_AXIOM = mp.mpf('16.339')
+GAMMA_AXIOM = K.GAMMA_AXIOM
 
 # Gravitational Hierarchy (Electroweak / Reduced Planck)
-V_EW = mp.mpf('246.22')       # GeV (Higgs VEV)
-M_PL_RED = mp.mpf('2.435e18') # GeV (Reduced Planck Mass)
+V_EW = K.V_EW           # GeV (Higgs VEV)
+M_PL_RED = K.M_PL_RED   # GeV (Reduced Planck Mass)
 
 # Observed Vacuum Energy (Planck 2018)
-RHO_OBSERVED = mp.mpf('2.53e-47') # GeV^4
+RHO_OBSERVED = K.RHO_OBSERVED # GeV^4
 
 # Holographic Normalization Factor
-PI_SQUARED_INV = 1.0 / (mp.pi**2)
+PI_SQUARED_INV = K.PI_SQ_INV
 
 # Logging Buffer
-log_buffer = []
+log_buffer = io.StringIO()
 
 def log_print(msg):
     """Prints to console and buffers for the report."""
-    print(msg)
-    log_buffer.append(msg)
+    line = f"{msg}\n"  # built once; one write each to console and buffer
+    sys.stdout.write(line)
+    log_buffer.write(line)
 
 log_print("===============================================================")
 log_print("   UIDT v3.6.1 CANONICAL VERIFICATION & COSMOLOGY SUITE")
@@ -73,12 +82,15 @@ log_print("===============================================================")
 # ==============================================================================
 # 2. QFT CORE: THE COUPLED EQUATION SYSTEM (HYBRID ROOT FINDER)
 # ==============================================================================
+@functools.lru_cache(maxsize=4096)
 def solve_exact_cubic_v(m_S, lambda_S, kappa):
     """
     Solves the vacuum stability equation EXACTLY for v (Cardano's method).
     Equation: m_S^2 * v + lambda_S * v^3 / 6 - kappa * C / Lambda = 0
     
     Returns v in GeV (NOT MeV)
+    Memoized on the exact (float) inputs: the solver revisits identical
+    points, and rounding the key would leak into the 1e-12 residual gate.
     """
     if lambda_S == 0:
         return (kappa * C_GLUON) / (LAMBDA * m_S**2)
@@ -87,19 +99,24 @@ def solve_exact_cubic_v(m_S, lambda_S, kappa):
     p = (6 * m_S**2) / lambda_S
     q = -(6 * kappa * C_GLUON) / (LAMBDA * lambda_S)
 
-    # Find roots using numpy (numerically stable)
+    # Find roots using numpy (numerically stable). Kept deliberately: the
+    # system is rank 2, and hybr's landing point on the solution curve (and
+    # hence the published m_S, kappa, v) depends on this root's rounding.
+    # The closed-form solver lives in UIDT_Master_Verification.py.
     roots = np.roots([1, 0, p, q])
 
     # Filter for the real, positive physical root (VEV)
-    real_roots = [r.real for r in roots if abs(r.imag) < 1e-10 and r.real > 0]
-    return real_roots[0] if real_roots else 0.0
+    mask = (np.abs(roots.imag) < 1e-10) & (roots.real > 0)
+    real_roots = roots.real[mask]
+    return real_roots[0] if real_roots.size else 0.0
 
 def core_system_root(vars):
     """
     The 3-Equation System defined as F(x) = 0.
     Variables: x = [m_S, kappa, lambda_S]
     """
-    m_S, kappa, lambda_S = vars
+    # Plain floats: hybr passes an ndarray, and NumPy scalar arithmetic is slower
+    m_S, kappa, lambda_S = vars.tolist() if isinstance(vars, np.ndarray) else vars
 
     # Guard against unphysical negative values
     if m_S <= 0 or kappa <= 0 or lambda_S <= 0:
@@ -186,15 +203,16 @@ log_print(f"  GAMMA (AXIOM)     : {mp.nstr(gamma, 10)} (Used for calculation)")
 log_print(f"\n[3] THE HOLOGRAPHIC VACUUM (Hierarchy Resolution)")
 log_print(f"  Theory: ρ_UIDT = (1/π²) · Δ⁴ · γ⁻¹² · (v_EW/M_Pl_red)²")
 
-# Calculations using mpmath
+# Calculations using mpmath (kept at 80 dps: values are reported to 15 digits
+# and the whole block is a handful of scalar operations executed once)
 delta_mp = mp.mpf(str(DELTA_TARGET))
 rho_planck = (M_PL_RED**4)
 rho_qcd = delta_mp**4
-suppression_gamma = gamma**(-12)
+suppression_gamma = K.GAMMA_POW_MINUS_12  # gamma is GAMMA_AXIOM
 rho_gamma_suppressed = rho_qcd * suppression_gamma
 
 # Apply EW hierarchy
-hierarchy_factor = (V_EW / M_PL_RED)**2
+hierarchy_factor = K.EW_PLANCK_RATIO_SQ
 rho_ew_hierarchy = rho_gamma_suppressed * hierarchy_factor
 
 # Apply holographic normalization
@@ -237,17 +255,23 @@ log_print(f"                      Evidence: Category D (Awaiting Verification)")
 # ==============================================================================
 log_print(f"\n[5] DESI-OPTIMIZED EVOLUTION (v3.6.1 Framework)")
 
+# Fit coefficients as exact decimal mpf (the float literals 0.0003 and
+# 0.0045 are not), built once rather than per call
+GAMMA_Z_C1 = mp.mpf('0.0003')
+GAMMA_Z_C2 = mp.mpf('0.0045')
+
+# γ(z) polynomial with γ₀ folded in, highest degree first (mp.polyval order)
+GAMMA_Z_POLY = [-gamma * GAMMA_Z_C2, gamma * GAMMA_Z_C1, gamma]
+
 def gamma_z(z):
     """Redshift-dependent gamma evolution (quadratic fit to DESI DR2)"""
-    # Use mpf for calculation
-    g_val = gamma
-    z_mp = mp.mpf(z)
-    return g_val * (1 + 0.0003*z_mp - 0.0045*z_mp**2)
+    # Use mpf for calculation; Horner evaluation via mp.polyval
+    return mp.polyval(GAMMA_Z_POLY, mp.mpf(z))
 
 z_vals = [0.0, 0.5, 1.0, 2.0]
 log_print(f"  Gamma Evolution γ(z) = γ₀(1 + 0.0003z - 0.0045z²):")
-for z in z_vals:
-    log_print(f"    z = {mp.nstr(z, 2)} : γ(z) = {mp.nstr(gamma_z(z), 6)}")
+for z, g in zip(z_vals, map(gamma_z, z_vals)):
+    log_print(f"    z = {mp.nstr(z, 2)} : γ(z) = {mp.nstr(g, 6)}")
 
 log_print("\n===============================================================")
 if closed:
@@ -261,31 +285,14 @@ log_print("===============================================================")
 # ==============================================================================
 # 🛡️ MODULE: SCIENTIFIC EVIDENCE RECORDER
 # ==============================================================================
-def generate_evidence_report():
-    """Generates immutable evidence report with v3.6.1 corrections"""
-    timestamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-    cpu_info = platform.processor() or "Unknown Architecture"
-    os_info = f"{platform.system()} {platform.release()}"
-    try:
-        python_ver = sys.version.split()[0]
-    except:
-        python_ver = "Unknown"
-    
-    try:
-        # Get the source code of the generate_evidence_report function itself
-        # This will act as the "script" for hashing purposes in an interactive environment
-        function_source = inspect.getsource(generate_evidence_report)
-        script_hash = hashlib.sha256(function_source.encode('utf-8')).hexdigest()
-    except Exception:
-        script_hash = "Unknown (Interactive Mode - Function Source Unavailable)"
-
-    report = f"""---
+# Evidence report layout, filled once by generate_evidence_report()
+_REPORT_TEMPLATE = """---
 title: "UIDT Verification Report: Canonical v3.6.1 (Clean State)"
 author: "Automated Verification Pipeline (AVP)"
 date: "{timestamp}"
 version: "3.6.1"
-status: "{"PASSED" if closed else "FAILED"}"
-signature: "SHA256:{script_hash[:16]}..."
+status: "{status}"
+signature: "SHA256:{signature}..."
 corrections: "VEV corrected to 47.7 MeV; Casimir reclassified to Category D"
 ---
 
@@ -311,11 +318,7 @@ corrections: "VEV corrected to 47.7 MeV; Casimir reclassified to Category D"
 ## 2. ⚙️ Execution Log (Stdout Capture)
 
 ```text
-"""
-    for line in log_buffer:
-        report += f"{line}\n"
-    
-    report += f"""```
+{log_body}```
 
 ---
 
@@ -332,7 +335,7 @@ corrections: "VEV corrected to 47.7 MeV; Casimir reclassified to Category D"
 
 ## 4. 🔍 Final Verdict
 
-The system status is: **{"✅ SCIENTIFICALLY VERIFIED (Clean State)" if closed else "❌ VERIFICATION FAILED"}**
+The system status is: **{verdict}**
 
 ### Evidence Classification Integrity:
 - ✅ Category A+ (Mathematical): Residuals < 10⁻⁴⁰
@@ -347,6 +350,42 @@ The system status is: **{"✅ SCIENTIFICALLY VERIFIED (Clean State)" if closed e
 **DOI:** 10.5281/zenodo.17835200
 """
 
+@functools.cache
+def _script_hash():
+    """SHA-256 of the report generator's source, computed once per process."""
+    try:
+        # Get the source code of the generate_evidence_report function itself
+        # (plus the report template it fills); this acts as the "script" for
+        # hashing purposes in an interactive environment
+        function_source = inspect.getsource(generate_evidence_report) + _REPORT_TEMPLATE
+        return hashlib.sha256(function_source.encode('utf-8')).hexdigest()
+    except Exception:
+        return "Unknown (Interactive Mode - Function Source Unavailable)"
+
+def generate_evidence_report():
+    """Generates immutable evidence report with v3.6.1 corrections"""
+    timestamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+    cpu_info = platform.processor() or "Unknown Architecture"
+    os_info = f"{platform.system()} {platform.release()}"
+    try:
+        python_ver = sys.version.split()[0]
+    except:
+        python_ver = "Unknown"
+    
+    script_hash = _script_hash()
+
+    report = _REPORT_TEMPLATE.format_map({
+        "timestamp": timestamp,
+        "status": "PASSED" if closed else "FAILED",
+        "signature": script_hash[:16],
+        "cpu_info": cpu_info,
+        "os_info": os_info,
+        "python_ver": python_ver,
+        "script_hash": script_hash,
+        "log_body": log_buffer.getvalue(),
+        "verdict": "✅ SCIENTIFICALLY VERIFIED (Clean State)" if closed else "❌ VERIFICATION FAILED",
+    })
+
     output_dir = "Supplementary_Results"
     try:
         os.makedirs(output_dir, exist_ok=True)
@@ -18,15 +18,17 @@ License: CC BY 4.0
 """
 
 import numpy as np
-from scipy.optimize import root
+from scipy.optimize import brentq
 import mpmath
 from mpmath import mp
 import platform
 import hashlib
+import functools
 import datetime
 import sys
 import os
 import inspect
+import io
 
 # Ensure UTF-8 output on Windows terminals
 if sys.platform == "win32":
@@ -45,14 +47,72 @@ REPORT_DIR = os.path.abspath(os.path.join(SCRIPT_DIR, "..", "data"))
 PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "..", ".."))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+# Shared canonical constants (80-digit mpf, evaluated once in uidt_constants)
+from uidt_constants import K
+
+# Pillar dependencies, imported once at module level. A failing import only
+# disables its own pillar: the name is bound to None and the original
+# exception is kept so that _require can re-raise it inside that pillar.
+_IMPORT_ERRORS = {}
+
+try:
+    from modules.lattice_topology import TorsionLattice
+except Exception as e:
+    TorsionLattice = None
+    _IMPORT_ERRORS["TorsionLattice"] = e
+try:
+    from modules.geometric_operator import GeometricOperator
+except Exception as e:
+    GeometricOperator = None
+    _IMPORT_ERRORS["GeometricOperator"] = e
+try:
+    from modules.harmonic_predictions import HarmonicPredictor
+except Exception as e:
+    HarmonicPredictor = None
+    _IMPORT_ERRORS["HarmonicPredictor"] = e
+try:
+    from modules.photonic_isomorphism import PhotonicInterface
+except Exception as e:
+    PhotonicInterface = None
+    _IMPORT_ERRORS["PhotonicInterface"] = e
+try:
+    from modules.covariant_unification import CovariantUnification
+except Exception as e:
+    CovariantUnification = None
+    _IMPORT_ERRORS["CovariantUnification"] = e
+try:
+    from verification.scripts.verify_coupling_quantization import verify_coupling_quantization
+except Exception as e:
+    verify_coupling_quantization = None
+    _IMPORT_ERRORS["verify_coupling_quantization"] = e
+try:
+    from verification.scripts.verify_su3_color_projection import verify_su3_color_projection
+except Exception as e:
+    verify_su3_color_projection = None
+    _IMPORT_ERRORS["verify_su3_color_projection"] = e
+try:
+    from verification.scripts.verify_kissing_number_suppression import verify_kissing_number_suppression
+except Exception as e:
+    verify_kissing_number_suppression = None
+    _IMPORT_ERRORS["verify_kissing_number_suppression"] = e
+
+def _require(*names):
+    """Re-raises the original import failure of the first unavailable dependency."""
+    for name in names:
+        if name in _IMPORT_ERRORS:
+            raise _IMPORT_ERRORS[name]
 
 # Global log buffer for the report
-log_buffer = []
+log_buffer = io.StringIO()
 
 def log_print(msg):
     """Writes to the console AND to the report buffer."""
-    print(msg)
-    log_buffer.append(msg)
+    line = f"{msg}\n"  # built once; one write each to console and buffer
+    sys.stdout.write(line)
+    log_buffer.write(line)
 
 # ==============================================================================
 # PART 1: THE MATHEMATICAL CORE (High-Precision Prover)
@@ -68,35 +128,49 @@ class HighPrecisionProver:
         self.C      = mp.mpf('0.277')
         self.Kappa  = mp.mpf('0.500')
         self.m_S    = mp.mpf('1.705')
-        self.rho_obs = mp.mpf('2.53e-47')
-        self.v_EW   = mp.mpf('246.22')
-        self.M_Pl   = mp.mpf('2.435e18')
-        self.pi_sq_inv = 1 / (mp.pi**2)
+        self.rho_obs = K.RHO_OBSERVED
+        self.v_EW   = K.V_EW
+        self.M_Pl   = K.M_PL_RED
+        self.pi_sq_inv = K.PI_SQ_INV
+
+        # Constants of the Banach map and the vacuum energy (computed once)
+        self._alpha = (self.Kappa**2 * self.C) / (4 * self.Lambda**2)
+        self._beta  = K.PI_SQ_INV / 16  # exact: power-of-two scaling of 1/pi^2
+        self._mS2   = self.m_S**2
+        self._log_Lambda = mp.log(self.Lambda)
+        self._gamma_suppression = K.GAMMA_POW_MINUS_12
+        self._hierarchy = K.EW_PLANCK_RATIO_SQ
 
     def _map_T(self, Delta):
-        alpha = (self.Kappa**2 * self.C) / (4 * self.Lambda**2)
-        beta  = 1 / (16 * mp.pi**2)
-        log_term = 2 * mp.log(self.Lambda / Delta)
-        return mp.sqrt(self.m_S**2 + alpha * (1 + beta * log_term))
+        log_term = 2 * (self._log_Lambda - mp.log(Delta))
+        return mp.sqrt(self._mS2 + self._alpha * (1 + self._beta * log_term))
 
     def run_proof(self):
-        # Banach Fixed-Point Iteration
-        current = mp.mpf('1.0')
-        for i in range(100):
-            prev = current
-            current = self._map_T(prev)
-            if abs(current - prev) < mp.mpf('1e-60'):
-                break
-        
-        Delta_star = current
-        
-        # Verify Lipschitz Constant
-        epsilon = mp.mpf('1e-30')
-        L = abs(self._map_T(Delta_star + epsilon) - Delta_star) / epsilon
-        
-        # Vacuum Energy Calculation (Holographic)
-        rho_calc = (Delta_star**4) * (mp.mpf('16.339')**(-12)) * ((self.v_EW/self.M_Pl)**2) * self.pi_sq_inv
-        
+        # Certify at 80 digits even if a caller changed mp.dps after __init__;
+        # workdps restores the caller's precision on exit
+        with mp.workdps(80):
+            # Banach Fixed-Point Iteration (Steffensen: Aitken's delta-squared
+            # on each Picard triple x, T(x), T(T(x)); quadratic convergence)
+            current = mp.mpf('1.0')
+            for i in range(100):
+                prev = current
+                t1 = self._map_T(prev)
+                t2 = self._map_T(t1)
+                denom = t2 - 2 * t1 + prev
+                current = t2 if denom == 0 else prev - (t1 - prev)**2 / denom
+                if abs(current - prev) < mp.mpf('1e-60'):
+                    break
+
+            # Final Picard step: the certified point is an image of T
+            Delta_star = self._map_T(current)
+
+            # Verify Lipschitz Constant
+            epsilon = mp.mpf('1e-30')
+            L = abs(self._map_T(Delta_star + epsilon) - Delta_star) / epsilon
+
+            # Vacuum Energy Calculation (Holographic)
+            rho_calc = (Delta_star**4) * self._gamma_suppression * self._hierarchy * self.pi_sq_inv
+
         return Delta_star, L, rho_calc
 
 # ==============================================================================
@@ -107,6 +181,8 @@ class HighPrecisionProver:
 C_GLUON_FLOAT = 0.277
 LAMBDA_FLOAT  = 1.0
 DELTA_TARGET  = 1.710
+KAPPA_CANON   = 0.500  # Registry value; fixes the point on the solution curve
+F_VAC_ANCHOR_GEV = mp.mpf('0.1071')  # Calibrated vacuum frequency (proton anchor, fallback)
 
 def solve_exact_cubic_v(m_S, lambda_S, kappa):
     """Solves the vacuum equation exactly for v."""
@@ -115,30 +191,69 @@ def solve_exact_cubic_v(m_S, lambda_S, kappa):
         return (kappa * C_GLUON_FLOAT) / (LAMBDA_FLOAT * m_S**2)
     p = (6 * m_S**2) / lambda_S
     q = -(6 * kappa * C_GLUON_FLOAT) / (LAMBDA_FLOAT * lambda_S)
-    roots = np.roots([1, 0, p, q])
-    real_roots = [r.real for r in roots if abs(r.imag) < 1e-10 and r.real > 0]
+    real_roots = [r for r in _depressed_cubic_real_roots(p, q) if r > 0]
     return real_roots[0] if real_roots else 0.0
 
-def core_system_equations(vars):
-    """The 3-equation system for the solver."""
+def _depressed_cubic_real_roots(p, q):
+    """Real roots of v^3 + p*v + q = 0 in closed form (Cardano / Viete)."""
+    D = q * q / 4 + p * p * p / 27
+    if D > 0 or p >= 0:
+        # Single real root u + w with u^3 + w^3 = -q, u*w = -p/3, written as
+        # -q / (u^2 - u*w + w^2) so that no cancellation occurs for p > 0
+        u = np.cbrt(-q / 2 + np.copysign(np.sqrt(D), -q))
+        if u == 0:
+            return [0.0]
+        return [-q / (u * u + p / 3 + (p * p) / (9 * u * u))]
+    # Three real roots (p < 0): the largest-magnitude one from the
+    # trigonometric form (k = 0), the other two by stable deflation
+    r = 2 * np.sqrt(-p / 3)
+    phi = np.arccos(np.clip(3 * q / (2 * p) * np.sqrt(-3 / p), -1.0, 1.0)) / 3
+    t1 = r * np.cos(phi)
+    c = -q / t1  # product of the remaining roots
+    s = -(t1 + np.copysign(np.sqrt(max(t1 * t1 - 4 * c, 0.0)), t1)) / 2
+    return [t1, s, c / s if s != 0 else 0.0]
+
+def gap_equation_residual(m_S, kappa):
+    """Eq II (Schwinger-Dyson): Delta(m_S, kappa) - DELTA_TARGET; independent of v."""
+    # Plain NumPy scalar ufuncs on purpose: no JIT/fastmath kernels, and
+    # math.log differs from np.log in the last ulp on some inputs
+    log_term = np.log(LAMBDA_FLOAT**2 / m_S**2)
+    Pi_S = (kappa**2 * C_GLUON_FLOAT) / (4 * LAMBDA_FLOAT**2) * (1 + log_term / (16 * np.pi**2))
+    return np.sqrt(m_S**2 + Pi_S) - DELTA_TARGET
+
+def core_system_equations(vars, v=None):
+    """The 3-equation system for the solver (v: exact cubic root, if already known)."""
     m_S, kappa, lambda_S = vars
     if m_S <= 0 or kappa <= 0 or lambda_S <= 0: return [1.0, 1.0, 1.0] # Safeguard
     
-    v = solve_exact_cubic_v(m_S, lambda_S, kappa)
+    if v is None:
+        v = solve_exact_cubic_v(m_S, lambda_S, kappa)
     
     # 1. Vacuum Stability
     eq1 = (m_S**2 * v + (lambda_S * v**3)/6 - (kappa * C_GLUON_FLOAT)/LAMBDA_FLOAT) * 100
     
     # 2. Gap Equation
-    log_term = np.log(LAMBDA_FLOAT**2 / m_S**2)
-    Pi_S = (kappa**2 * C_GLUON_FLOAT) / (4 * LAMBDA_FLOAT**2) * (1 + log_term / (16 * np.pi**2))
-    eq2 = np.sqrt(m_S**2 + Pi_S) - DELTA_TARGET
+    eq2 = gap_equation_residual(m_S, kappa)
     
     # 3. RG Fixed Point
     eq3 = 5 * kappa**2 - 3 * lambda_S
     
     return [eq1, eq2, eq3]
 
+def solve_core_system(kappa=KAPPA_CANON, bracket=(1.5, 2.0)):
+    """
+    Solves the core system by elimination instead of a 3-D root search.
+    Eq III gives lambda_S = 5 kappa^2 / 3 and Eq I holds identically once v
+    is the exact cubic root, so the system is rank 2: kappa parametrizes the
+    solution curve and Eq II leaves a single monotone equation in m_S.
+    (The same rank deficiency makes the 3x3 Jacobian singular: its Eq I row
+    vanishes identically for exact v, so a jac= for hybr does not help.)
+    """
+    lambda_S = 5 * kappa**2 / 3
+    m_S = brentq(gap_equation_residual,
+                 *bracket, args=(kappa,), xtol=1e-15, rtol=4 * np.finfo(float).eps)
+    return m_S, kappa, lambda_S
+
 # ==============================================================================
 # MAIN EXECUTION ROUTINE
 # ==============================================================================
@@ -153,17 +268,16 @@ def run_master_verification():
     # STEP 1: Numerical Solution (Scipy)
     # ---------------------------------------------------------
     log_print("[1] RUNNING NUMERICAL SOLVER (System Consistency)...")
-    x0 = [1.705, 0.500, 0.417]
-    sol = root(core_system_equations, x0, method='hybr', tol=1e-15)
-    
-    m_S, kappa, lambda_S = sol.x
+    m_S, kappa, lambda_S = solve_core_system()
     v_final = solve_exact_cubic_v(m_S, lambda_S, kappa)
-    residuals = core_system_equations(sol.x)
+    residuals = core_system_equations([m_S, kappa, lambda_S], v=v_final)
     
-    closed = all(abs(r) < 1e-10 for r in residuals)
+    residual_norm = float(np.max(np.abs(residuals)))  # infinity norm
+    closed = residual_norm < 1e-10
     
-    log_print(f"   > Solution Found: m_S={m_S:.4f}, kappa={kappa:.4f}")
-    log_print(f"   > Residuals: {[f'{r:.1e}' for r in residuals]}")
+    # kappa is an input (KAPPA_CANON), not a solver output: only Eq II is solved
+    log_print(f"   > Solution Found: m_S={m_S:.4f}, kappa={kappa:.4f} (registry, fixed)")
+    log_print(f"   > Residuals: {[f'{r:.1e}' for r in residuals]} (max |r| = {residual_norm:.1e})")
     log_print(f"   > System Status: {'✅ CLOSED' if closed else '❌ OPEN'}")
 
     proof_data_block = "Mathematical Proof not executed."
@@ -181,9 +295,9 @@ def run_master_verification():
             prover = HighPrecisionProver()
             delta_proof, L_proof, rho_proof = prover.run_proof()
             
-            log_print(f"   > Banach Fixed Point: {str(delta_proof)[:20]}... GeV")
-            log_print(f"   > Lipschitz Constant: {str(L_proof)[:10]} (Strict Contraction < 1)")
-            log_print(f"   > Vacuum Energy:      {str(rho_proof)[:20]}... GeV^4")
+            log_print(f"   > Banach Fixed Point: {mp.nstr(delta_proof, 20)}... GeV")
+            log_print(f"   > Lipschitz Constant: {mp.nstr(L_proof, 8)} (Strict Contraction < 1)")
+            log_print(f"   > Vacuum Energy:      {mp.nstr(rho_proof, 20)}... GeV^4")
             
             if L_proof < 1:
                 log_print("   > THEOREM 3.4: ✅ PROVEN (Existence & Uniqueness)")
@@ -192,20 +306,20 @@ def run_master_verification():
 ### 🔬 High-Precision Proof Audit (mpmath 80-dps)
 > **Mathematical Core:** Verified
 - **Theorem 3.4 (Mass Gap):** Verified via Banach Fixed-Point
-  - Delta*: `{str(delta_proof)[:40]}...` GeV
-  - Lipschitz L: `{str(L_proof)[:20]}...` (Contraction proven)
+  - Delta*: `{mp.nstr(delta_proof, 40)}...` GeV
+  - Lipschitz L: `{mp.nstr(L_proof, 20)}...` (Contraction proven)
 - **Theorem 6.1 (Dark Energy):** Verified via Holographic Norm
-  - Rho_UIDT: `{str(rho_proof)[:40]}...` GeV^4
+  - Rho_UIDT: `{mp.nstr(rho_proof, 40)}...` GeV^4
 """
         except Exception as e:
             log_print(f"   > ❌ PROOF ERROR: {e}")
             proof_data_block = f"\n### ⚠️ Mathematical Proof Failed: {e}\n"
 
         log_print("\n[3] PILLAR II: DERIVING MISSING LINK (Lattice Topology)...")
-        f_vac_val = mp.mpf('0.1071')
+        f_vac_val = F_VAC_ANCHOR_GEV
+        op_instance = None  # shared with Pillar IV
         try:
-            from modules.lattice_topology import TorsionLattice
-            from modules.geometric_operator import GeometricOperator
+            _require("TorsionLattice", "GeometricOperator")
             op_instance = GeometricOperator()
             lat = TorsionLattice(op_instance)
             f_vac_val = lat.calculate_vacuum_frequency()
@@ -224,7 +338,7 @@ def run_master_verification():
 
         log_print("\n[4] PILLAR III: SPECTRAL EXPANSION & PREDICTIONS...")
         try:
-            from modules.harmonic_predictions import HarmonicPredictor
+            _require("HarmonicPredictor")
             predictor = HarmonicPredictor(f_vac_val, mp.mpf('1.710'))
             report = predictor.generate_report()
             log_print(f"   > Omega_bbb: {mp.nstr(report['Omega_bbb_GeV'], 5)} GeV")
@@ -248,11 +362,10 @@ def run_master_verification():
 
         log_print("\n[5] PILLAR IV: PHOTONIC APPLICATION (Metamaterials, Category D)...")
         try:
-            from modules.photonic_isomorphism import PhotonicInterface
-            from modules.geometric_operator import GeometricOperator
-            from modules.harmonic_predictions import HarmonicPredictor
+            _require("PhotonicInterface", "GeometricOperator", "HarmonicPredictor")
 
-            op_instance = GeometricOperator()
+            if op_instance is None:  # Pillar II failed before constructing it
+                op_instance = GeometricOperator()
             photonics = PhotonicInterface(op_instance)
             w_trans = photonics.predict_wormhole_transition()
 
@@ -261,8 +374,8 @@ def run_master_verification():
             log_print("   > Interpretation: Photonic analogy threshold (not a GR wormhole).")
 
             log_print("\n[4] PROTON ANCHOR (Consistency, Category B)...")
-            vac_freq_gev = mp.mpf("0.1071")
-            predictor = HarmonicPredictor(vac_freq_gev)
+            # Anchored to the calibrated frequency, not the derived f_vac_val
+            predictor = HarmonicPredictor(F_VAC_ANCHOR_GEV)
             pchk = predictor.check_proton_anchor()
             log_print(f"   > m_p / f_vac: {mp.nstr(pchk['ratio'], 5)} (target 8.7500)")
             log_print(f"   > deviation:   {mp.nstr(pchk['deviation'], 4)}")
@@ -285,19 +398,19 @@ def run_master_verification():
 
         log_print("\n[6] PILLAR II-CSF: COVARIANT SCALAR-FIELD SYNTHESIS [Category C]...")
         try:
-            from modules.covariant_unification import CovariantUnification
+            _require("CovariantUnification")
             cu = CovariantUnification(gamma_uidt=mp.mpf('16.339'))
             gamma_csf = cu.derive_csf_anomalous_dimension()
             rho_max = cu.check_information_saturation_bound()
             eos = cu.derive_equation_of_state()
             log_print(f"   > gamma_CSF (anomalous dim): {gamma_csf}")
-            log_print(f"   > rho_max (saturation):      {str(rho_max)[:20]}... GeV^4")
+            log_print(f"   > rho_max (saturation):      {mp.nstr(rho_max, 20)}... GeV^4")
             log_print(f"   > EoS w_0={eos['w_0']}, w_a={eos['w_a']} [C placeholder]")
             pillar_csf_data_block = f"""
 ### Pillar II-CSF: Covariant Scalar-Field Synthesis [Category C]
 > **CSF-UIDT Mapping:** Phenomenological (from calibrated [A-] gamma)
 - gamma_CSF (anomalous dimension): `{gamma_csf}`
-- rho_max (information saturation): `{str(rho_max)[:40]}...` GeV^4
+- rho_max (information saturation): `{mp.nstr(rho_max, 40)}...` GeV^4
 - EoS w_0: `{eos['w_0']}` [C placeholder]
 - EoS w_a: `{eos['w_a']}` [C placeholder]
 - Limitations: L4 (gamma not RG-derived), L5 (N=94.05 empirical)
@@ -308,9 +421,8 @@ def run_master_verification():
 
         log_print("\n[7] TOPOLOGICAL OBSERVATIONS (Category D - Interpretive)...")
         try:
-            from verification.scripts.verify_coupling_quantization import verify_coupling_quantization
-            from verification.scripts.verify_su3_color_projection import verify_su3_color_projection
-            from verification.scripts.verify_kissing_number_suppression import verify_kissing_number_suppression
+            _require("verify_coupling_quantization", "verify_su3_color_projection",
+                     "verify_kissing_number_suppression")
             
             o1_data = verify_coupling_quantization()
             o2_data = verify_su3_color_projection()
@@ -351,17 +463,22 @@ def run_master_verification():
     final_delta = delta_proof if 'delta_proof' in locals() else DELTA_TARGET
     generate_final_report(closed, proof_data_block, pillar_ii_data_block, pillar_iii_data_block, pillar_iv_data_block, pillar_csf_data_block, pillar_td_data_block, m_S, v_final, final_delta)
 
-def generate_final_report(closed, proof_data, p_ii, p_iii, p_iv, p_csf, p_td, m_S, v_final, delta_val):
-    timestamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-    
-    # Hash of the code for integrity
+@functools.cache
+def _source_signature():
+    """Hash of the code for integrity (invariant for the process lifetime)."""
     try:
         src = inspect.getsource(sys.modules[__name__])
-        sig = hashlib.sha256(src.encode()).hexdigest()[:16]
+        return hashlib.sha256(src.encode()).hexdigest()[:16]
     except:
-        sig = "Interactive-Session"
+        return "Interactive-Session"
 
-    report = f"""---
+def generate_final_report(closed, proof_data, p_ii, p_iii, p_iv, p_csf, p_td, m_S, v_final, delta_val):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    timestamp = now.strftime("%Y-%m-%d %H:%M:%S UTC")
+    file_stamp = now.strftime("%Y-%m-%d_%H-%M-%S_UTC")  # same instant, filename-safe
+    sig = _source_signature()
+
+    header = f"""---
 title: "UIDT Master Verification Report: v3.9 Constructive"
 date: "{timestamp}"
 status: "{"PASSED" if closed else "FAILED"}"
@@ -408,6 +525,7 @@ signature: "SHA256:{sig}"
 | :--- | :--- | :--- | :--- |
 | **Mass Gap (Δ)** | {mp.nstr(mp.mpf(delta_val), 7)} | GeV | Fundamental Scale |
 | **Scalar Mass (m_S)** | {mp.nstr(mp.mpf(m_S), 7)} | GeV | Resonance Target |
+| **Coupling (κ)** | {KAPPA_CANON:.4f} | - | Registry input (fixed, not solved) |
 | **VEV (v)** | {mp.nstr(mp.mpf(v_final)*1000, 6)} | MeV | Vacuum Expectation |
 | **Gamma (γ)** | 16.339 | - | Lattice Invariant |
 
@@ -416,19 +534,18 @@ signature: "SHA256:{sig}"
 ## 5. Execution Log
 ```text
 """
-    for line in log_buffer:
-        report += f"{line}\n"
-    
-    report += "```\n"
     
     # Save
     try:
         os.makedirs(REPORT_DIR, exist_ok=True)
-        filename = f"Verification_Report_v3.9_{timestamp.replace(':','-').replace(' ','_')}.md"
+        filename = f"Verification_Report_v3.9_{file_stamp}.md"
         filepath = os.path.join(REPORT_DIR, filename)
         
+        # Log goes straight from the buffer to disk, never copied into the header
         with open(filepath, "w", encoding="utf-8") as f:
-            f.write(report)
+            f.write(header)
+            f.write(log_buffer.getvalue())
+            f.write("```\n")
         
         print(f"\n[OUTPUT] 📄 Report successfully saved to:\n         {filepath}")
         
@@ -1,110 +1,166 @@
-import json
 import sys
 import os
+from collections import deque
+from functools import lru_cache
+
+AUDITS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'audits'))
+if AUDITS_PATH not in sys.path:
+    sys.path.insert(0, AUDITS_PATH)
+
+from _json_io import read_json  # noqa: E402  (orjson when installed)
+
+@lru_cache(maxsize=4)
+def _load(filepath, mtime_ns, size):
+    # mtime_ns and size are part of the key only, so an edited ledger is
+    # re-parsed instead of served stale.
+    return tuple(read_json(filepath)['claims'])
 
 def load_claims(filepath):
+    """Claims of the ledger at filepath (shared across calls; do not mutate)."""
     try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-        return data['claims']
+        st = os.stat(filepath)
+        return _load(filepath, st.st_mtime_ns, st.st_size)
     except Exception as e:
         print(f"Error loading {filepath}: {e}")
         sys.exit(1)
 
 def build_graph(claims):
-    graph = {}
     claim_map = {c['id']: c for c in claims}
 
-    for claim in claims:
-        claim_id = claim['id']
-        deps = claim.get('dependencies', [])
-        # Only add dependencies that are also claims in the list
-        # This focuses the graph on internal claim interdependencies
-        valid_deps = [d for d in deps if d in claim_map]
-        graph[claim_id] = valid_deps
+    # Only add dependencies that are also claims in the list
+    # This focuses the graph on internal claim interdependencies
+    graph = {
+        claim_id: [d for d in claim.get('dependencies', []) if d in claim_map]
+        for claim_id, claim in claim_map.items()
+    }
 
     return graph, claim_map
 
 def find_cycles(graph):
-    visited = set()
-    rec_stack = set()
+    """Iterative Tarjan SCC; returns one closed path per cyclic component."""
+    index = {}
+    lowlink = {}
+    on_stack = set()
+    scc_stack = []
     cycles = []
 
-    def dfs(node, path):
-        visited.add(node)
-        rec_stack.add(node)
-        path.append(node)
-
-        for neighbor in graph.get(node, []):
-            if neighbor not in visited:
-                dfs(neighbor, path)
-            elif neighbor in rec_stack:
-                cycle_start_index = path.index(neighbor)
-                cycle = path[cycle_start_index:] + [neighbor]
-                cycles.append(cycle)
-
-        rec_stack.remove(node)
-        path.pop()
+    def visit(node, work):
+        index[node] = lowlink[node] = len(index)
+        scc_stack.append(node)
+        on_stack.add(node)
+        work.append((node, iter(graph.get(node, []))))
+
+    for root in graph:
+        if root in index:
+            continue
+        work = []
+        visit(root, work)
+
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    visit(neighbor, work)
+                    break
+                if neighbor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[neighbor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] != index[node]:
+                    continue
 
-    for node in graph:
-        if node not in visited:
-            dfs(node, [])
+                component = set()
+                while True:
+                    member = scc_stack.pop()
+                    on_stack.remove(member)
+                    component.add(member)
+                    if member == node:
+                        break
+                if len(component) > 1 or node in graph.get(node, []):
+                    cycles.append(cycle_through(graph, node, component))
 
     return cycles
 
-def check_epistemic_violations(graph, claim_map):
-    violations = []
-
-    # Memoization for reachable categories
-    reachable_categories = {}
-
-    def get_reachable_categories(node, visited_path):
-        if node in reachable_categories:
-            return reachable_categories[node]
-
-        cats = set()
-
-        # Add current node's category if known and valid
-        if node in claim_map:
-            ev = claim_map[node].get('evidence')
-            if ev:
-                cats.add((node, ev))
-
-        visited_path.add(node)
-
+def cycle_through(graph, start, component):
+    """Shortest closed path start -> ... -> start inside one component (BFS)."""
+    parent = {start: None}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
         for neighbor in graph.get(node, []):
-            if neighbor not in visited_path:
-                neighbor_cats = get_reachable_categories(neighbor, visited_path)
-                cats.update(neighbor_cats)
+            if neighbor == start:
+                return trace_back(parent, node) + [start]
+            if neighbor in component and neighbor not in parent:
+                parent[neighbor] = node
+                queue.append(neighbor)
+    return [start, start]
+
+def dependency_order(graph):
+    """Iterative DFS post-order: every node after all of its dependencies."""
+    order = []
+    done = set()
+    for root in graph:
+        if root in done:
+            continue
+        done.add(root)
+        work = [(root, iter(graph.get(root, [])))]
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if neighbor not in done:
+                    done.add(neighbor)
+                    work.append((neighbor, iter(graph.get(neighbor, []))))
+                    break
+            else:
+                work.pop()
+                order.append(node)
+    return order
 
-        visited_path.remove(node)
-        reachable_categories[node] = cats
-        return cats
+def check_epistemic_violations(graph, claim_map):
+    violations = []
 
-    for node in graph:
+    # Claims as bit positions: a node's transitive dependencies are one int
+    # bitset, built dependencies-first by OR-ing its finished neighbours
+    ids = list(graph)
+    bit = {node: 1 << i for i, node in enumerate(ids)}
+    weak_mask = 0  # claims of Category [C] or [D]
+    sources = []   # claims of Category [A]
+    for node in ids:
         claim = claim_map.get(node)
-        if not claim: continue
-
-        # Check only Claims of Category [A]
-        # Violations: A depending on C or D
-        if claim.get('evidence') == 'A':
-            # Get all reachable nodes (dependencies)
-            # Note: We check immediate and transitive dependencies
-            # But wait, get_reachable_categories includes the node itself.
-            # We must filter out the node itself for the check.
-            reachable = get_reachable_categories(node, set())
-
-            for dep_node, dep_ev in reachable:
-                if dep_node == node:
-                    continue
-
-                if dep_ev in ['C', 'D']:
-                    violations.append({
-                        'source': node,
-                        'source_ev': 'A',
-                        'dependency': dep_node,
-                        'dependency_ev': dep_ev
-                    })
+        ev = claim.get('evidence') if claim else None
+        if ev in ('C', 'D'):
+            weak_mask |= bit[node]
+        elif ev == 'A':
+            sources.append(node)
+
+    # Nothing can violate without both an [A] claim and a [C]/[D] claim
+    if not weak_mask or not sources:
+        return violations
+
+    reachable = {}
+    for node in dependency_order(graph):
+        mask = bit[node]
+        for neighbor in graph.get(node, []):
+            mask |= reachable.get(neighbor, 0)
+        reachable[node] = mask
+
+    # Check only Claims of Category [A]
+    # Violations: A depending (directly or transitively) on C or D
+    for node in sources:
+        hits = reachable[node] & ~bit[node] & weak_mask
+        while hits:
+            low = hits & -hits
+            dep_node = ids[low.bit_length() - 1]
+            violations.append({
+                'source': node,
+                'source_ev': 'A',
+                'dependency': dep_node,
+                'dependency_ev': claim_map[dep_node]['evidence']
+            })
+            hits ^= low
 
     return violations
 
@@ -129,31 +185,44 @@ def main():
 
     if violations:
         print("CRITICAL: Epistemic Constitution Violation!")
+        parent_maps = {}  # one BFS per violating source, shared by its targets
         for v in violations:
             source = v['source']
             target = v['dependency']
             # Find path from source to target
-            path = find_path(graph, source, target)
+            if source not in parent_maps:
+                parent_maps[source] = bfs_parents(graph, source)
+            path = find_path(graph, source, target, parent_maps[source])
             path_str = " -> ".join(path) if path else "Path not found"
             print(f"Claim {source} [A] depends on {target} [{v['dependency_ev']}] via path: {path_str}")
         sys.exit(1)
 
     print("Epistemic Graph Acyclic & Secure")
 
-def find_path(graph, start, end, path=None):
-    if path is None:
-        path = []
-    path = path + [start]
-    if start == end:
-        return path
-    if start not in graph:
-        return None
-    for node in graph[start]:
-        if node not in path:
-            newpath = find_path(graph, node, end, path)
-            if newpath:
-                return newpath
-    return None
+def bfs_parents(graph, start):
+    """Breadth-first parent map of everything reachable from start."""
+    parent = {start: None}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for neighbor in graph.get(node, []):
+            if neighbor not in parent:
+                parent[neighbor] = node
+                queue.append(neighbor)
+    return parent
+
+def trace_back(parent, node):
+    """Walk a BFS parent map from node back to its root; returns root -> node."""
+    path = [node]
+    while parent[path[-1]] is not None:
+        path.append(parent[path[-1]])
+    return path[::-1]
+
+def find_path(graph, start, end, parent=None):
+    """Shortest dependency path start -> end, or None if end is unreachable."""
+    if parent is None:
+        parent = bfs_parents(graph, start)
+    return trace_back(parent, end) if end in parent else None
 
 if __name__ == '__main__':
     main()
@@ -8,12 +8,12 @@ sys.path.append(os.path.abspath("clay-submission/05_LatticeSimulation"))
 
 # Import necessary classes and functions
 try:
-    from UIDTv3_7_2_HMC_Real import UIDTLattice, UIDTConstants, run_hmc, random_su3_algebra, project_su3, random_su3
+    from UIDTv3_7_2_HMC_Real import UIDTLattice, UIDTConstants, run_hmc, random_su3_algebra_field, project_su3_field
 except ImportError:
     print("Error: Could not import UIDTv3_7_2_HMC_Real.py. Make sure the path is correct.")
     sys.exit(1)
 
-# Use scipy expm for correctness
+# Use scipy expm for correctness (batched over leading axes of X)
 def su3_exp(X):
     return expm(X)
 
@@ -34,63 +34,62 @@ class MetropolisLattice(UIDTLattice):
         self.metropolis_acceptance_scalar = 0.0
         self.metropolis_steps_gauge = 0
         self.metropolis_steps_scalar = 0
+        self._build_neighbour_tables()
         # Add noise to initial configuration
         self.add_noise()
 
+    def _build_neighbour_tables(self):
+        """Periodic neighbour lookup: shift_f[mu][site] = site + mu, shift_b[mu][site] = site - mu.
+
+        Sites and neighbours are plain-int (t, z, y, x) tuples, so the
+        per-link action changes index U and S without any modulo arithmetic.
+        """
+        extents = np.array([[self.Nt], [self.Ns], [self.Ns], [self.Ns]])
+        sites = np.indices((self.Nt, self.Ns, self.Ns, self.Ns)).reshape(4, -1)
+        keys = list(map(tuple, sites.T.tolist()))
+        self.shift_f = []
+        self.shift_b = []
+        for mu in range(self.Nd):
+            step = np.zeros((4, 1), dtype=int)
+            step[mu] = 1
+            self.shift_f.append(dict(zip(keys, map(tuple, ((sites + step) % extents).T.tolist()))))
+            self.shift_b.append(dict(zip(keys, map(tuple, ((sites - step) % extents).T.tolist()))))
+
     def add_noise(self):
         print("Adding noise to initial configuration...")
-        for idx in np.ndindex(self.Nt, self.Ns, self.Ns, self.Ns, self.Nd):
-            rand_alg = random_su3_algebra() * 0.1
-            self.U[idx] = su3_exp(rand_alg) @ self.U[idx]
-            self.U[idx] = project_su3(self.U[idx])
+        # Whole field at once: one batched expm / SVD projection over all links
+        rand_alg = random_su3_algebra_field(self.U.shape) * 0.1
+        self.U = project_su3_field(su3_exp(rand_alg) @ self.U)
 
     def local_gauge_action_change(self, U_new, t, z, y, x, mu):
         # Calculate sum of staples (6 staples)
         staple_sum = np.zeros((3, 3), dtype=complex)
+        site = (t, z, y, x)
+        x_mu = self.shift_f[mu][site]
 
         for nu in range(self.Nd):
             if nu == mu:
                 continue
 
             # Forward staple
-            shifts_mu = [0, 0, 0, 0]
-            shifts_mu[mu] = 1
-            t_mu = (t + shifts_mu[0]) % self.Nt
-            z_mu = (z + shifts_mu[1]) % self.Ns
-            y_mu = (y + shifts_mu[2]) % self.Ns
-            x_mu = (x + shifts_mu[3]) % self.Ns
-
-            shifts_nu = [0, 0, 0, 0]
-            shifts_nu[nu] = 1
-            t_nu = (t + shifts_nu[0]) % self.Nt
-            z_nu = (z + shifts_nu[1]) % self.Ns
-            y_nu = (y + shifts_nu[2]) % self.Ns
-            x_nu = (x + shifts_nu[3]) % self.Ns
-
-            U_nu_xmu = self.U[t_mu, z_mu, y_mu, x_mu, nu]
-            U_mu_xnu = self.U[t_nu, z_nu, y_nu, x_nu, mu]
-            U_nu_x = self.U[t, z, y, x, nu]
-
-            staple_fwd = U_nu_xmu @ U_mu_xnu.conj().T @ U_nu_x.conj().T
+            x_nu = self.shift_f[nu][site]
 
-            # Backward staple
-            shifts_nu_back = [0, 0, 0, 0]
-            shifts_nu_back[nu] = -1
-            t_nub = (t + shifts_nu_back[0]) % self.Nt
-            z_nub = (z + shifts_nu_back[1]) % self.Ns
-            y_nub = (y + shifts_nu_back[2]) % self.Ns
-            x_nub = (x + shifts_nu_back[3]) % self.Ns
+            U_nu_xmu = self.U[x_mu + (nu,)]
+            U_mu_xnu = self.U[x_nu + (mu,)]
+            U_nu_x = self.U[site + (nu,)]
 
-            t_mu_nub = (t_mu + shifts_nu_back[0]) % self.Nt
-            z_mu_nub = (z_mu + shifts_nu_back[1]) % self.Ns
-            y_mu_nub = (y_mu + shifts_nu_back[2]) % self.Ns
-            x_mu_nub = (x_mu + shifts_nu_back[3]) % self.Ns
+            # B^dag C^dag = (C B)^dag: one conjugate transpose per staple
+            staple_fwd = U_nu_xmu @ (U_nu_x @ U_mu_xnu).conj().T
 
-            U_nu_xmu_nub = self.U[t_mu_nub, z_mu_nub, y_mu_nub, x_mu_nub, nu]
-            U_mu_xnub = self.U[t_nub, z_nub, y_nub, x_nub, mu]
-            U_nu_xnub = self.U[t_nub, z_nub, y_nub, x_nub, nu]
+            # Backward staple
+            x_nub = self.shift_b[nu][site]
+            x_mu_nub = self.shift_b[nu][x_mu]
+
+            U_nu_xmu_nub = self.U[x_mu_nub + (nu,)]
+            U_mu_xnub = self.U[x_nub + (mu,)]
+            U_nu_xnub = self.U[x_nub + (nu,)]
 
-            staple_bwd = U_nu_xmu_nub.conj().T @ U_mu_xnub.conj().T @ U_nu_xnub
+            staple_bwd = (U_mu_xnub @ U_nu_xmu_nub).conj().T @ U_nu_xnub
 
             staple_sum += staple_fwd + staple_bwd
 
@@ -98,34 +97,21 @@ class MetropolisLattice(UIDTLattice):
 
         # Staple sum is path x+mu -> x.
         # Plaquette is U_mu(x) * Staple.
-        # Trace of closed loop: Tr(U * Staple)
-        term_new = np.real(np.trace(U_new @ staple_sum))
-        term_old = np.real(np.trace(U_old @ staple_sum))
-
-        delta_S = - (self.beta / 3.0) * (term_new - term_old)
+        # Trace of closed loop: Tr(U * Staple). The change Tr((U_new - U_old) * Staple)
+        # is one elementwise product, Tr(A B) = sum_ij A_ij B_ji, with no matmul.
+        delta_S = - (self.beta / 3.0) * np.real(np.sum((U_new - U_old) * staple_sum.T))
 
         return delta_S
 
     def local_scalar_action_change(self, S_new, t, z, y, x):
         S_old = self.S[t, z, y, x]
+        site = (t, z, y, x)
         kinetic_change = 0.0
         for mu in range(self.Nd):
-            shifts_fwd = [0, 0, 0, 0]
-            shifts_fwd[mu] = 1
-            t_f = (t + shifts_fwd[0]) % self.Nt
-            z_f = (z + shifts_fwd[1]) % self.Ns
-            y_f = (y + shifts_fwd[2]) % self.Ns
-            x_f = (x + shifts_fwd[3]) % self.Ns
-            S_fwd = self.S[t_f, z_f, y_f, x_f]
+            S_fwd = self.S[self.shift_f[mu][site]]
             term_fwd_new = 0.5 * (S_fwd - S_new)**2
             term_fwd_old = 0.5 * (S_fwd - S_old)**2
-            shifts_bwd = [0, 0, 0, 0]
-            shifts_bwd[mu] = -1
-            t_b = (t + shifts_bwd[0]) % self.Nt
-            z_b = (z + shifts_bwd[1]) % self.Ns
-            y_b = (y + shifts_bwd[2]) % self.Ns
-            x_b = (x + shifts_bwd[3]) % self.Ns
-            S_bwd = self.S[t_b, z_b, y_b, x_b]
+            S_bwd = self.S[self.shift_b[mu][site]]
             term_bwd_new = 0.5 * (S_new - S_bwd)**2
             term_bwd_old = 0.5 * (S_old - S_bwd)**2
             kinetic_change += (term_fwd_new - term_fwd_old) + (term_bwd_new - term_bwd_old)
@@ -138,13 +124,15 @@ class MetropolisLattice(UIDTLattice):
         return kinetic_change + (pot_new - pot_old)
 
     def metropolis_sweep(self):
+        # Proposal steps M do not depend on the current links, so the whole
+        # sweep's worth is drawn and exponentiated in one batched expm call
+        steps = su3_exp(random_su3_algebra_field(self.U.shape) * METROPOLIS_STEP_SCALE_GAUGE)
         for idx in np.ndindex(self.Nt, self.Ns, self.Ns, self.Ns, self.Nd):
             t, z, y, x, mu = idx
-            rand_alg = random_su3_algebra() * METROPOLIS_STEP_SCALE_GAUGE
-            M = su3_exp(rand_alg)
+            M = steps[idx]
             U_old = self.U[idx]
             U_new = M @ U_old
-            U_new = project_su3(U_new)
+            U_new = project_su3_field(U_new)
             delta_S = self.local_gauge_action_change(U_new, t, z, y, x, mu)
             if delta_S <= 0 or np.random.rand() < np.exp(-delta_S):
                 self.U[idx] = U_new
@@ -190,19 +178,15 @@ def run_metropolis(Ns=8, Nt=16, beta=6.0, n_therm=100, n_meas=200, n_skip=5, ver
 def compute_autocorrelation(series):
     """Compute integrated autocorrelation time tau for a time series.
 
-    Uses vectorized NumPy slice operations to replace the O(N^2) nested
-    Python loop. For each lag t the normalised autocorrelation coefficient
-    is computed as:
+    The lagged products sum(centered[i] * centered[i + t]) for all lags come
+    from one zero-padded FFT (Wiener-Khinchin), O(N log N) instead of one
+    O(N) slice product per lag. Each lag keeps its own normalisation:
 
         rho[t] = mean(centered[:-t] * centered[t:]) / var   (t > 0)
         rho[0] = 1  (by definition)
 
-    The t == 0 case is handled explicitly because centered[:-0] would
-    produce an empty slice in NumPy.
-
-    Performance: O(N) per lag (NumPy C loop) instead of O(N) Python
-    iterations, reducing wall-clock time by ~50-200x for typical
-    measurement series (n ~ 200-2000).
+    tau = 1/2 + sum of rho[t] up to (excluding) the first lag with rho <= 0,
+    over lags t < N // 2.
     """
     series = np.asarray(series, dtype=float)
     n = len(series)
@@ -215,16 +199,15 @@ def compute_autocorrelation(series):
 
     centered = series - mean
 
-    rho = [1.0]  # rho[0] = 1 by definition
-    for t in range(1, n // 2):
-        rho.append(np.mean(centered[:-t] * centered[t:]) / var)
+    # Padding to 2N keeps the circular correlation from wrapping around
+    spectrum = np.fft.rfft(centered, n=2 * n)
+    lagged = np.fft.irfft(spectrum * spectrum.conj(), n=2 * n)[1:n // 2]
+    rho = lagged / (n - np.arange(1, n // 2)) / var
 
-    tau = 0.5
-    for t in range(1, len(rho)):
-        if rho[t] <= 0:
-            break
-        tau += rho[t]
-    return tau
+    # Window ends at the first non-positive lag
+    non_positive = np.flatnonzero(rho <= 0)
+    cut = non_positive[0] if non_positive.size else len(rho)
+    return 0.5 + float(np.sum(rho[:cut]))
 
 if __name__ == "__main__":
     NS = 2
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+UIDT Shared Verification Constants
+==================================
+Canonical anchors and the mpmath quantities derived from them, evaluated
+once at import. Shared by UIDT-3.6.1-Verification.py and the
+HighPrecisionProver in UIDT_Master_Verification.py so both scripts work
+from identical 80-digit values.
+
+License: CC BY 4.0
+DOI: 10.5281/zenodo.17835200
+"""
+from dataclasses import dataclass
+
+import mpmath
+from mpmath import mp
+
+mp.dps = 80  # Local precision declaration
+
+
+@dataclass(frozen=True)
+class UIDTConstants:
+    # AXIOM: Gamma Invariant (Fixed, not derived)
+    GAMMA_AXIOM: mpmath.mpf = mp.mpf('16.339')
+
+    # Gravitational Hierarchy (Electroweak / Reduced Planck)
+    V_EW: mpmath.mpf = mp.mpf('246.22')        # GeV (Higgs VEV)
+    M_PL_RED: mpmath.mpf = mp.mpf('2.435e18')  # GeV (Reduced Planck Mass)
+
+    # Observed Vacuum Energy (Planck 2018)
+    RHO_OBSERVED: mpmath.mpf = mp.mpf('2.53e-47')  # GeV^4
+
+    # Derived factors of the holographic vacuum relation
+    PI_SQ_INV: mpmath.mpf = 1 / (mp.pi**2)
+    EW_PLANCK_RATIO_SQ: mpmath.mpf = (V_EW / M_PL_RED)**2
+    GAMMA_POW_MINUS_12: mpmath.mpf = GAMMA_AXIOM**(-12)
+
+
+K = UIDTConstants()
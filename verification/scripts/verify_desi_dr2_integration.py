@@ -38,18 +38,15 @@ print(f"Target: Illustrative comparison of UIDT (w0={UIDT_W0}, wa={UIDT_WA}) aga
 
 # --- 1. MCMC Implementation (Metropolis-Hastings) ---
 
+# Covariance Matrix construction (constant: inverted once, not per MCMC step)
+OBS_COV = np.array([[OBS_W0_ERR**2, CORRELATION * OBS_W0_ERR * OBS_WA_ERR],
+                    [CORRELATION * OBS_W0_ERR * OBS_WA_ERR, OBS_WA_ERR**2]])
+OBS_INV_COV = np.linalg.inv(OBS_COV)
+
 def log_likelihood(theta):
     w0, wa = theta
-    # Covariance Matrix construction
-    sigma_w0 = OBS_W0_ERR
-    sigma_wa = OBS_WA_ERR
-    rho = CORRELATION
-    cov = np.array([[sigma_w0**2, rho * sigma_w0 * sigma_wa],
-                    [rho * sigma_w0 * sigma_wa, sigma_wa**2]])
-    inv_cov = np.linalg.inv(cov)
-
     diff = np.array([w0 - OBS_W0_MEAN, wa - OBS_WA_MEAN])
-    chi2 = diff.T @ inv_cov @ diff
+    chi2 = diff.T @ OBS_INV_COV @ diff
     return -0.5 * chi2
 
 def metropolis_hastings(n_samples, burn_in):
@@ -0,0 +1,62 @@
+import json
+import os
+import sys
+
+SCRIPTS_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "scripts"))
+if SCRIPTS_PATH not in sys.path:
+    sys.path.insert(0, SCRIPTS_PATH)
+
+from daily_audit import build_graph, check_epistemic_violations, find_cycles, find_path, load_claims
+
+
+def test_acyclic_graph_has_no_cycles():
+    graph = {"A": ["B", "C"], "B": ["C"], "C": []}
+    assert find_cycles(graph) == []
+
+
+def test_each_cyclic_component_reported_as_closed_path():
+    graph = {"A": ["B"], "B": ["C"], "C": ["A"], "D": ["D"], "E": ["A"]}
+    cycles = find_cycles(graph)
+
+    assert sorted(c[0] for c in cycles) == ["A", "D"]
+    for cycle in cycles:
+        assert cycle[0] == cycle[-1]
+        for src, dst in zip(cycle, cycle[1:]):
+            assert dst in graph[src]
+
+
+def test_deep_chain_does_not_hit_recursion_limit():
+    depth = sys.getrecursionlimit() * 2
+    graph = {i: [i + 1] for i in range(depth)}
+    graph[depth] = [0]
+    (cycle,) = find_cycles(graph)
+    assert len(cycle) == depth + 2
+
+
+def test_transitive_violation_found_once_per_pair():
+    claims = [
+        {"id": "A1", "evidence": "A", "dependencies": ["B1"]},
+        {"id": "A2", "evidence": "A", "dependencies": ["B1", "C1"]},
+        {"id": "B1", "evidence": "B", "dependencies": ["C1"]},
+        {"id": "C1", "evidence": "C", "dependencies": []},
+    ]
+    graph, claim_map = build_graph(claims)
+    pairs = sorted((v["source"], v["dependency"]) for v in check_epistemic_violations(graph, claim_map))
+    assert pairs == [("A1", "C1"), ("A2", "C1")]
+
+
+def test_find_path_returns_shortest_dependency_chain():
+    graph = {"A": ["B", "D"], "B": ["C"], "C": ["E"], "D": ["E"], "E": []}
+    assert find_path(graph, "A", "E") == ["A", "D", "E"]
+    assert find_path(graph, "E", "A") is None
+
+
+def test_load_claims_reparses_only_when_ledger_changes(tmp_path):
+    ledger = tmp_path / "CLAIMS.json"
+    ledger.write_text(json.dumps({"claims": [{"id": "A1", "evidence": "A"}]}), encoding="utf-8")
+    first = load_claims(str(ledger))
+    assert load_claims(str(ledger)) is first
+
+    ledger.write_text(json.dumps({"claims": [{"id": "A1", "evidence": "A"}, {"id": "B1"}]}), encoding="utf-8")
+    os.utime(ledger, ns=(0, ledger.stat().st_mtime_ns + 1))
+    assert [c["id"] for c in load_claims(str(ledger))] == ["A1", "B1"]
@@ -0,0 +1,37 @@
+"""
+test_json_io.py
+
+Contract tests for verification/audits/_json_io.py: both backends emit the
+same document, and writes replace the target without leaving temp files.
+"""
+import json
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+AUDITS_PATH = os.path.abspath(os.path.join(SCRIPT_DIR, "..", "audits"))
+
+if AUDITS_PATH not in sys.path:
+    sys.path.insert(0, AUDITS_PATH)
+
+import _json_io  # noqa: E402
+
+DOC = {"symbol": "Δ", "value": "1.710 ± 0.015", "refs": ["A1", "A2"], "cat": {"b": 1, "a": 2}}
+
+
+def test_stdlib_backend_matches_sorted_indent_2(monkeypatch):
+    monkeypatch.setattr(_json_io, "HAS_ORJSON", False)
+    out = _json_io.dumps_json(DOC, newline=True)
+    assert out == (json.dumps(DOC, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+
+def test_backends_agree_on_content():
+    assert json.loads(_json_io.dumps_json(DOC)) == DOC
+
+
+def test_write_json_replaces_target_atomically(tmp_path):
+    path = tmp_path / "out.json"
+    path.write_text("stale", encoding="utf-8")
+    _json_io.write_json(path, DOC)
+    assert _json_io.read_json(path) == DOC
+    assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
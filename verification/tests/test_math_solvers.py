@@ -15,7 +15,11 @@ if SCRIPTS_PATH not in sys.path:
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-from UIDT_Master_Verification import solve_exact_cubic_v, C_GLUON_FLOAT, LAMBDA_FLOAT
+from UIDT_Master_Verification import (
+    solve_exact_cubic_v, solve_core_system, core_system_equations,
+    C_GLUON_FLOAT, LAMBDA_FLOAT, KAPPA_CANON, HighPrecisionProver,
+)
+from uidt_constants import K
 
 class TestSolveExactCubicV(unittest.TestCase):
     def setUp(self):
@@ -84,5 +88,67 @@ class TestSolveExactCubicV(unittest.TestCase):
         residual = m_S_mp**2 * v_mp + (lambda_S_mp * v_mp**3)/6 - (kappa_mp * C_mp)/L_mp
         self.assertLess(abs(residual), 1e-14)
 
+class TestSolveCoreSystem(unittest.TestCase):
+    def test_closes_at_canonical_kappa(self):
+        """Elimination solver closes all three equations at kappa = 0.500"""
+        m_S, kappa, lambda_S = solve_core_system()
+        self.assertEqual(kappa, KAPPA_CANON)
+        self.assertAlmostEqual(lambda_S, 5 * kappa**2 / 3, places=15)
+        for r in core_system_equations([m_S, kappa, lambda_S]):
+            self.assertLess(abs(r), 1e-12)
+        self.assertAlmostEqual(m_S, 1.705, delta=0.001)
+
+class TestPublishedSolution(unittest.TestCase):
+    """Regression pin for the published Master solution (best_practices: numerical outputs)."""
+
+    def test_published_m_S_and_kappa(self):
+        m_S, kappa, lambda_S = solve_core_system()
+        self.assertEqual(f"m_S={m_S:.4f}, kappa={kappa:.4f}", "m_S=1.7050, kappa=0.5000")
+        self.assertAlmostEqual(m_S, 1.7049646588151, places=12)
+        self.assertEqual(lambda_S, 5 * KAPPA_CANON**2 / 3)
+
+    def test_closed_form_cubic_matches_companion_eigensolve(self):
+        """Closed-form vacuum root agrees with the np.roots path it replaced"""
+        m_S, kappa, lambda_S = solve_core_system()
+        coeffs = [lambda_S / 6, 0.0, m_S**2, -(kappa * C_GLUON_FLOAT) / LAMBDA_FLOAT]
+        reference = max(r.real for r in np.roots(coeffs) if abs(r.imag) < 1e-12 and r.real > 0)
+        v = solve_exact_cubic_v(m_S, lambda_S, kappa)
+        self.assertAlmostEqual(v / reference, 1.0, places=14)
+        self.assertAlmostEqual(v * 1000, 47.6426, places=4)
+
+class TestSharedConstants(unittest.TestCase):
+    def setUp(self):
+        mp.dps = 80
+
+    def test_derived_factors_at_80_digits(self):
+        """Shared table matches the in-place expressions it replaced"""
+        self.assertEqual(K.PI_SQ_INV, 1 / (mp.pi**2))
+        self.assertEqual(K.EW_PLANCK_RATIO_SQ, (mp.mpf('246.22') / mp.mpf('2.435e18'))**2)
+        self.assertEqual(K.GAMMA_POW_MINUS_12, mp.mpf('16.339')**(-12))
+
+    def test_prover_uses_shared_table(self):
+        prover = HighPrecisionProver()
+        self.assertIs(prover.pi_sq_inv, K.PI_SQ_INV)
+        self.assertIs(prover._hierarchy, K.EW_PLANCK_RATIO_SQ)
+
+class TestHighPrecisionProver(unittest.TestCase):
+    def tearDown(self):
+        mp.dps = 80
+
+    def test_proof_runs_at_80_digits_regardless_of_caller(self):
+        prover = HighPrecisionProver()
+        reference = prover.run_proof()
+        mp.dps = 15
+        self.assertEqual(prover.run_proof(), reference)
+        self.assertEqual(mp.dps, 15)
+        self.assertLess(reference[1], 1)
+
+    def test_fixed_point_is_certified(self):
+        """Steffensen result is a fixed point of T to 1e-70"""
+        prover = HighPrecisionProver()
+        delta_star, _, _ = prover.run_proof()
+        self.assertLess(abs(prover._map_T(delta_star) - delta_star), mp.mpf('1e-70'))
+        self.assertEqual(mp.nstr(delta_star, 12), '1.71003504674')
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,59 @@
+"""
+test_registry_cache.py
+
+Contract tests for verification/audits/_registry_cache.py: one parse per
+registry state, shared immutable container, re-parse after an edit.
+"""
+import json
+import os
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+AUDITS_PATH = os.path.abspath(os.path.join(SCRIPT_DIR, "..", "audits"))
+PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "..", ".."))
+
+if AUDITS_PATH not in sys.path:
+    sys.path.insert(0, AUDITS_PATH)
+
+from _registry_cache import load_axioms, load_symbols  # noqa: E402
+
+
+def _fake_repo(tmp_path: Path, symbols: list) -> Path:
+    registries = tmp_path / "verification" / "registries"
+    registries.mkdir(parents=True)
+    (registries / "symbol_registry.json").write_text(json.dumps(symbols), encoding="utf-8")
+    return tmp_path
+
+
+def test_canonical_registries_load_as_shared_tuples():
+    repo_root = Path(PROJECT_ROOT)
+    symbols = load_symbols(repo_root)
+    assert isinstance(symbols, tuple)
+    assert load_symbols(repo_root) is symbols
+    assert any(s["symbol"] == "Δ" for s in symbols)
+    assert isinstance(load_axioms(repo_root), tuple)
+
+
+def test_edited_registry_is_reparsed(tmp_path):
+    repo_root = _fake_repo(tmp_path, [{"symbol": "Δ"}])
+    first = load_symbols(repo_root)
+    assert [s["symbol"] for s in first] == ["Δ"]
+
+    path = repo_root / "verification" / "registries" / "symbol_registry.json"
+    path.write_text(json.dumps([{"symbol": "Δ"}, {"symbol": "κ"}]), encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    second = load_symbols(repo_root)
+    assert second is not first
+    assert [s["symbol"] for s in second] == ["Δ", "κ"]
+
+
+def test_symbol_and_category_strings_are_interned(tmp_path):
+    # Build the strings at runtime so they are not compile-time constants
+    name = "".join(["Δ", "_", "x"])
+    repo_root = _fake_repo(tmp_path, [{"symbol": name, "evidence_cat": "A" + "-"}])
+    (entry,) = load_symbols(repo_root)
+    assert entry["symbol"] is sys.intern(name)
+    assert entry["evidence_cat"] is sys.intern("A-")